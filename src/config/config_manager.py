@@ -39,6 +39,9 @@ class ConfigManager:
         self.config_file = os.path.join(self.config_dir, "settings.json")
         self.config = self.DEFAULT_CONFIG.copy()
         
+        # 메모리에만 반영되고 아직 파일에 저장되지 않은 변경이 있는지 여부
+        self._dirty = False
+        
         # 설정 로드
         self._load_config()
     
@@ -101,6 +104,7 @@ class ConfigManager:
             
             with open(self.config_file, 'w', encoding='utf-8') as f:
                 json.dump(self.config, f, indent=4, ensure_ascii=False)
+            self._dirty = False
             self.logger.info(f"설정 파일 저장 완료: {self.config_file}")
         except Exception as e:
             self.logger.error(f"설정 파일 저장 중 오류 발생: {str(e)}")
@@ -117,6 +121,17 @@ class ConfigManager:
         self.config[key] = value
         self._save_config()
     
+    def set_deferred(self, key: str, value: Any):
+        """설정 값을 메모리에만 반영합니다. 파일 저장은 flush() 호출 시 수행됩니다."""
+        if self.config.get(key) != value:
+            self.config[key] = value
+            self._dirty = True
+    
+    def flush(self):
+        """지연된 변경 사항이 있으면 파일에 저장합니다."""
+        if self._dirty:
+            self._save_config()
+    
     def update(self, config_dict: Dict[str, Any]):
         """여러 설정 값을 한 번에 업데이트합니다."""
         self.config.update(config_dict)
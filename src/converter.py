@@ -2,6 +2,7 @@ import OpenImageIO as oiio
 import os
 from typing import List, Tuple, Dict, Any
 from src.services.log_service import LogService
+from src.utils.file_utils import format_file_size
 import traceback
 from src.converters.converter_factory import ConverterFactory
 
@@ -40,11 +41,11 @@ class ImageConverter:
                 self.logger.error(error_msg)
                 return False, error_msg
                 
-            # 출력 디렉토리 생성
+            # 출력 디렉토리 생성 (이미 있으면 그대로 사용, 존재 확인을 따로 하지 않음)
             output_dir = os.path.dirname(output_path)
-            if output_dir and not os.path.exists(output_dir):
+            if output_dir:
                 try:
-                    os.makedirs(output_dir)
+                    os.makedirs(output_dir, exist_ok=True)
                 except Exception as e:
                     error_msg = f"출력 디렉토리 생성 실패: {str(e)}"
                     self.logger.error(error_msg)
@@ -98,6 +99,10 @@ class ImageConverter:
                 except Exception as e:
                     self.logger.error(f"출력 이미지 리소스 정리 중 오류: {str(e)}")
     
+    def release_cache(self):
+        """OpenImageIO 공유 이미지 캐시에 보관된 데이터를 모두 해제합니다."""
+        self.converter.release_cache()
+    
     def get_image_info(self, image_path: str) -> dict:
         """
         이미지의 기본 정보를 반환합니다.
@@ -124,13 +129,15 @@ class ImageConverter:
                 return {"error": error_msg}
             
             spec = input_image.spec()
+            file_size = os.path.getsize(image_path)
             info = {
                 "width": spec.width,
                 "height": spec.height,
                 "channels": spec.nchannels,
                 "format": spec.format,
                 "pixel_type": str(spec.format),
-                "file_size": os.path.getsize(image_path)
+                "file_size": file_size,
+                "file_size_display": format_file_size(file_size)
             }
             
             self.logger.debug(f"이미지 정보: {info}")
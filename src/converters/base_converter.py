@@ -1,12 +1,19 @@
+import OpenImageIO as oiio
 from abc import ABC, abstractmethod
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Callable
 from src.services.log_service import LogService
 
+# 이 크기(바이트)를 넘는 이미지는 스캔라인 단위로 나누어 변환
+_LARGE_IMAGE_BYTES = 256 * 1024 * 1024
+_SCANLINE_CHUNK = 64
+
 class BaseConverter(ABC):
     """모든 변환기의 기본 클래스"""
     
     def __init__(self):
         self.logger = LogService()
+        # ImageBuf 등이 파일 데이터를 보관하는 OIIO 공유 이미지 캐시
+        self._image_cache = oiio.ImageCache(True)
         
     @abstractmethod
     def get_supported_formats(self) -> List[str]:
@@ -38,4 +45,41 @@ class BaseConverter(ABC):
         Returns:
             이미지 정보를 담은 딕셔너리
         """
-        pass 
\ No newline at end of file
+        pass
+        
+    def release_cache(self):
+        """공유 이미지 캐시에 보관된 모든 데이터를 해제합니다."""
+        self._image_cache.invalidate_all(True)
+        self.logger.debug("OIIO 이미지 캐시 해제")
+        
+    def _is_large_scanline_image(self, spec: oiio.ImageSpec) -> bool:
+        """스캔라인 청크 단위로 나누어 변환할 대용량 스캔라인 이미지인지 확인합니다."""
+        return spec.tile_width == 0 and spec.image_bytes() > _LARGE_IMAGE_BYTES
+        
+    def _copy_scanlines(self, input_image, output_image, spec: oiio.ImageSpec,
+                        progress: Callable[[float], None] = None) -> bool:
+        """
+        이미지를 스캔라인 청크 단위로 읽어 출력 이미지에 씁니다.
+        
+        Args:
+            input_image: 열린 입력 이미지
+            output_image: 열린 출력 이미지
+            spec: 입력 이미지 스펙
+            progress: 청크마다 진행률(0.0 ~ 1.0)을 받는 콜백
+            
+        Returns:
+            성공 여부
+        """
+        yend_total = spec.y + spec.height
+        for ybegin in range(spec.y, yend_total, _SCANLINE_CHUNK):
+            yend = min(ybegin + _SCANLINE_CHUNK, yend_total)
+            pixels = input_image.read_scanlines(0, 0, ybegin, yend, spec.z, 0, spec.nchannels, spec.format)
+            if pixels is None:
+                self.logger.error(f"스캔라인 읽기 실패: {ybegin}-{yend}")
+                return False
+            if not output_image.write_scanlines(ybegin, yend, spec.z, pixels):
+                self.logger.error(f"스캔라인 쓰기 실패: {ybegin}-{yend}")
+                return False
+            if progress:
+                progress((yend - spec.y) / spec.height)
+        return True
@@ -34,6 +34,7 @@ class BatchService:
         """단일 파일 변환 작업 추가"""
         task = {
             "input_path": input_path,
+            "basename": os.path.basename(input_path),
             "output_path": output_path,
             "options": options or {},
             "status": "pending",
@@ -66,10 +67,8 @@ class BatchService:
         if options is None:
             options = {}
             
-        # 지원되는 확장자 목록
-        supported_extensions = []
-        for format_name, ext in self.converter.supported_formats.items():
-            supported_extensions.append(ext.lower())
+        # 지원되는 확장자 집합 (파일마다 확인하므로 집합으로 한 번만 생성)
+        supported_extensions = frozenset(ext.lower() for ext in self.converter.supported_formats.values())
             
         # 출력 확장자 결정
         output_ext = None
@@ -271,20 +270,24 @@ class BatchService:
                 task = self.tasks[task_id]
                 pending.append({
                     "input_path": task["input_path"],
+                    "basename": task["basename"],
                     "output_path": task["output_path"],
                     "status": task["status"],
                     "duration": 0
                 })
                 
             # 처리 중인 작업
+            current_time = time.time()
             for task_id, task in self.processing_tasks.items():
-                current_time = time.time()
                 duration = current_time - task["start_time"] if task["start_time"] else 0
                 processing.append({
                     "input_path": task["input_path"],
+                    "basename": task["basename"],
                     "output_path": task["output_path"],
                     "status": task["status"],
-                    "duration": duration
+                    "status_text": "처리 중",
+                    "duration": duration,
+                    "duration_str": f"{duration:.1f}초"
                 })
                 
             # 완료된 작업
@@ -292,9 +295,12 @@ class BatchService:
                 task = self.tasks[task_id]
                 completed.append({
                     "input_path": task["input_path"],
+                    "basename": task["basename"],
                     "output_path": task["output_path"],
                     "status": task["status"],
-                    "duration": task["duration"]
+                    "status_text": "완료",
+                    "duration": task["duration"],
+                    "duration_str": f"{task['duration']:.1f}초"
                 })
                 
             # 실패한 작업
@@ -302,10 +308,13 @@ class BatchService:
                 task = self.tasks[task_id]
                 failed.append({
                     "input_path": task["input_path"],
+                    "basename": task["basename"],
                     "output_path": task["output_path"],
                     "status": task["status"],
+                    "status_text": self._failed_status_text(task["error"]),
                     "error": task["error"],
-                    "duration": task["duration"]
+                    "duration": task["duration"],
+                    "duration_str": f"{task['duration']:.1f}초"
                 })
                 
             return {
@@ -319,10 +328,26 @@ class BatchService:
                 "percentage": int((len(self.completed_tasks) + len(self.failed_tasks)) / len(self.tasks) * 100) if self.tasks else 0
             }
             
+    @staticmethod
+    def _failed_status_text(error_msg: str) -> str:
+        """실패 작업의 상태 표시 문자열 (오류 메시지가 있으면 앞부분을 괄호로 표시)"""
+        if not error_msg:
+            return "실패"
+        error_brief = error_msg[:15] + "..." if len(error_msg) > 15 else error_msg
+        return f"실패 ({error_brief})"
+        
     def is_running(self):
         """작업 실행 중 여부"""
         return self.running
         
+    def get_pending_tasks(self) -> List[Dict[str, str]]:
+        """대기 중인 작업의 입력 경로와 파일명 목록 (추가된 순서)"""
+        with self.lock:
+            return [
+                {"input_path": task["input_path"], "basename": task["basename"]}
+                for task in (self.tasks[task_id] for task_id in self.pending_tasks)
+            ]
+        
     def get_results(self):
         """변환 결과 요약"""
         return {
@@ -1,13 +1,21 @@
 import OpenImageIO as oiio
 import os
+import shutil
 import numpy as np
 import time
 from typing import Dict, List, Tuple, Any, Optional, Callable
 from src.converters.base_converter import BaseConverter
 from src.utils.debug.debug_utils import get_detailed_error_info, format_error_for_log
-from src.utils.image_utils import ImageFormatUtils
+from src.utils.file_utils import format_file_size
+from src.utils.image_utils import (
+    get_conversion_settings, adjust_bit_depth, has_alpha_support,
+    apply_tone_mapping, remove_alpha_channel
+)
 from src.color_management import ColorManager, ToneMapMethod
 
+# 픽셀 값을 바꾸는 색상 조정 옵션 (하나라도 0이 아니면 파일을 그대로 복사할 수 없음)
+_PIXEL_ADJUST_OPTIONS = ("brightness", "contrast", "saturation", "exposure_stops")
+
 class ConversionStage:
     """변환 단계를 정의하는 열거형 클래스"""
     INIT = 0        # 초기화
@@ -34,6 +42,10 @@ class ConversionStage:
             return names[stage]
         return "알 수 없음"
 
+class ConversionCancelled(Exception):
+    """진행 상황 콜백에서 변환 취소를 알리기 위해 발생시키는 예외"""
+    pass
+
 class EnhancedConverter(BaseConverter):
     """다양한 이미지 포맷 간 고품질 변환을 지원하는 변환기"""
     
@@ -69,6 +81,8 @@ class EnhancedConverter(BaseConverter):
         - stage: 현재 진행 중인 단계 (ConversionStage 상수)
         - progress: 현재 단계의 진행률 (0.0 ~ 1.0)
         - info: 추가 정보 딕셔너리
+        
+        콜백에서 ConversionCancelled를 발생시키면 변환이 중단됩니다.
         """
         self._progress_callback = callback
     
@@ -142,13 +156,11 @@ class EnhancedConverter(BaseConverter):
                                     message="오류 발생", error=error_msg)
                 return False, error_msg, {"error_type": "FileNotFound"}
                 
-            # 출력 디렉토리 생성
+            # 출력 디렉토리 생성 (이미 있으면 그대로 사용, 존재 확인을 따로 하지 않음)
             output_dir = os.path.dirname(output_path)
-            if output_dir and not os.path.exists(output_dir):
+            if output_dir:
                 try:
-                    os.makedirs(output_dir)
-                    self._report_progress(ConversionStage.INIT, 1.0, 
-                                        message="출력 디렉토리 생성 완료")
+                    os.makedirs(output_dir, exist_ok=True)
                 except Exception as e:
                     error_info = get_detailed_error_info(e)
                     error_msg = f"출력 디렉토리 생성 실패: {error_info['message']}"
@@ -156,10 +168,24 @@ class EnhancedConverter(BaseConverter):
                     self._report_progress(ConversionStage.INIT, 1.0, 
                                         message="오류 발생", error=error_msg)
                     return False, error_msg, {"error_info": error_info}
+                    
+                # 진행 보고는 try 밖에서 (콜백의 취소 예외가 디렉토리 생성 실패로 처리되지 않도록)
+                self._report_progress(ConversionStage.INIT, 1.0, 
+                                    message="출력 디렉토리 준비 완료")
             
             # 색 관리 기능 사용 여부 확인
             use_color_management = options.get('use_color_management', True)
             
+            # 같은 포맷이고 픽셀을 바꾸는 처리가 없으면 디코딩/인코딩 없이 파일 복사
+            if input_format == output_format and not use_color_management and \
+                    self._is_unchanged_copy(input_path, output_format, options):
+                if os.path.abspath(input_path) != os.path.abspath(output_path):
+                    shutil.copyfile(input_path, output_path)
+                self._report_progress(ConversionStage.COMPLETE, 1.0, 
+                                    message="동일 포맷 파일 복사 완료")
+                self.logger.info(f"동일 포맷 파일 복사 완료: {output_path}")
+                return True, "동일 포맷이므로 파일을 복사했습니다.", {"copied": True}
+            
             if use_color_management:
                 # 색 관리 설정 적용
                 input_profile_name = options.get('input_profile')
@@ -240,7 +266,7 @@ class EnhancedConverter(BaseConverter):
             else:
                 # 기존 방식으로 처리 (OpenImageIO 직접 사용)
                 # 변환 설정 가져오기
-                pre_settings, post_settings = ImageFormatUtils.get_conversion_settings(input_format, output_format)
+                pre_settings, post_settings = get_conversion_settings(input_format, output_format)
                 
                 # 옵션에서 추가 설정 가져오기
                 if 'exposure' in options:
@@ -287,58 +313,72 @@ class EnhancedConverter(BaseConverter):
                                     width=spec.width, height=spec.height, 
                                     channels=spec.nchannels)
                 
-                # 이미지 데이터 읽기
-                self._report_progress(ConversionStage.ANALYZE, 0.5, 
-                                    message="이미지 데이터 읽는 중")
-                pixel_data = input_image.read_image()
-                
-                if pixel_data is None:
-                    error_msg = "이미지 데이터를 읽을 수 없습니다."
-                    self.logger.error(error_msg)
-                    error_details = oiio.geterror()
-                    debug_info["oiio_error"] = error_details
-                    self.logger.error(f"OIIO 에러 상세: {error_details}")
+                # 톤 매핑, 알파 제거처럼 이미지 전체를 처리할 필요가 없는 대용량 이미지는
+                # 스캔라인 청크 단위로 읽고 써서 최대 메모리 사용량을 제한
+                drops_alpha = spec.nchannels == 4 and not has_alpha_support(output_format)
+                if self._is_large_scanline_image(spec) and not drops_alpha and \
+                        not pre_settings.get("apply_tone_mapping") and not pre_settings.get("remove_alpha"):
+                    self.logger.debug(f"스캔라인 청크 변환 사용: {spec.image_bytes()} bytes")
                     self._report_progress(ConversionStage.ANALYZE, 1.0, 
-                                        message="오류 발생", error=error_msg)
-                    return False, error_msg, debug_info
-                
-                # 이미지 분석 완료
-                self._report_progress(ConversionStage.ANALYZE, 1.0, 
-                                    message="이미지 분석 완료")
-                
-                # 색 공간 변환 단계 (이 방식에서는 생략)
-                self._report_progress(ConversionStage.COLOR, 0.0, 
-                                    message="색 공간 처리 중")
-                self._report_progress(ConversionStage.COLOR, 1.0, 
-                                    message="색 공간 처리 완료")
-                
-                # 이미지 처리 단계
-                self._report_progress(ConversionStage.PROCESS, 0.0, 
-                                    message="이미지 데이터 처리 중")
-                
-                # 픽셀 데이터 전처리
-                processed_data = self._apply_pre_processing(pixel_data, spec, pre_settings)
-                
-                # 이미지 처리 완료
-                self._report_progress(ConversionStage.PROCESS, 1.0, 
-                                    message="이미지 처리 완료")
-                
-                # 출력 파일 준비
-                self._report_progress(ConversionStage.SAVE, 0.0, 
-                                    message="출력 파일 준비 중")
-                
-                # 출력 스펙 조정
-                output_spec = ImageFormatUtils.adjust_bit_depth(spec, output_format)
-                
-                # 특정 포맷에 맞게 채널 수 조정
-                if not ImageFormatUtils.has_alpha_support(output_format) and output_spec.nchannels == 4:
-                    output_spec.nchannels = 3
+                                        message="이미지 분석 완료")
+                    self._report_progress(ConversionStage.SAVE, 0.0, 
+                                        message="이미지 저장 중 (스캔라인 단위)")
                     
-                # 출력 이미지 생성 및 쓰기
-                self._report_progress(ConversionStage.SAVE, 0.5, 
-                                    message="이미지 저장 중")
-                
-                success = self._write_output_image(processed_data, output_spec, output_path, post_settings)
+                    success = self._stream_output_image(input_image, spec, output_format, 
+                                                        output_path, post_settings)
+                else:
+                    # 이미지 데이터 읽기
+                    self._report_progress(ConversionStage.ANALYZE, 0.5, 
+                                        message="이미지 데이터 읽는 중")
+                    pixel_data = input_image.read_image()
+                    
+                    if pixel_data is None:
+                        error_msg = "이미지 데이터를 읽을 수 없습니다."
+                        self.logger.error(error_msg)
+                        error_details = oiio.geterror()
+                        debug_info["oiio_error"] = error_details
+                        self.logger.error(f"OIIO 에러 상세: {error_details}")
+                        self._report_progress(ConversionStage.ANALYZE, 1.0, 
+                                            message="오류 발생", error=error_msg)
+                        return False, error_msg, debug_info
+                    
+                    # 이미지 분석 완료
+                    self._report_progress(ConversionStage.ANALYZE, 1.0, 
+                                        message="이미지 분석 완료")
+                    
+                    # 색 공간 변환 단계 (이 방식에서는 생략)
+                    self._report_progress(ConversionStage.COLOR, 0.0, 
+                                        message="색 공간 처리 중")
+                    self._report_progress(ConversionStage.COLOR, 1.0, 
+                                        message="색 공간 처리 완료")
+                    
+                    # 이미지 처리 단계
+                    self._report_progress(ConversionStage.PROCESS, 0.0, 
+                                        message="이미지 데이터 처리 중")
+                    
+                    # 픽셀 데이터 전처리
+                    processed_data = self._apply_pre_processing(pixel_data, spec, pre_settings)
+                    
+                    # 이미지 처리 완료
+                    self._report_progress(ConversionStage.PROCESS, 1.0, 
+                                        message="이미지 처리 완료")
+                    
+                    # 출력 파일 준비
+                    self._report_progress(ConversionStage.SAVE, 0.0, 
+                                        message="출력 파일 준비 중")
+                    
+                    # 출력 스펙 조정
+                    output_spec = adjust_bit_depth(spec, output_format)
+                    
+                    # 특정 포맷에 맞게 채널 수 조정
+                    if not has_alpha_support(output_format) and output_spec.nchannels == 4:
+                        output_spec.nchannels = 3
+                    
+                    # 출력 이미지 생성 및 쓰기
+                    self._report_progress(ConversionStage.SAVE, 0.5, 
+                                        message="이미지 저장 중")
+                    
+                    success = self._write_output_image(processed_data, output_spec, output_path, post_settings)
                 
                 if not success:
                     error_msg = "이미지 변환 중 오류가 발생했습니다."
@@ -361,12 +401,21 @@ class EnhancedConverter(BaseConverter):
             self.logger.info(f"이미지 변환 완료: {output_path}")
             return True, f"{input_format}에서 {output_format}으로 변환 완료", debug_info
             
+        except ConversionCancelled:
+            self.logger.info(f"이미지 변환 취소: {input_path}")
+            return False, "변환이 취소되었습니다.", {"cancelled": True}
+            
         except Exception as e:
             error_info = get_detailed_error_info(e)
             error_msg = f"이미지 변환 중 오류 발생: {error_info['message']}"
             self.logger.error(format_error_for_log(error_info))
-            self._report_progress(ConversionStage.PROCESS, 1.0, 
-                                message="오류 발생", error=error_msg)
+            try:
+                self._report_progress(ConversionStage.PROCESS, 1.0, 
+                                    message="오류 발생", error=error_msg)
+            except ConversionCancelled:
+                # 오류 보고 중 취소되면 예외를 밖으로 내보내지 않고 취소로 처리
+                self.logger.info(f"이미지 변환 취소: {input_path}")
+                return False, "변환이 취소되었습니다.", {"cancelled": True}
             return False, error_msg, {"error_info": error_info}
             
         finally:
@@ -377,6 +426,28 @@ class EnhancedConverter(BaseConverter):
                     error_info = get_detailed_error_info(e)
                     self.logger.error(f"입력 이미지 리소스 정리 중 오류: {format_error_for_log(error_info)}")
     
+    def _is_unchanged_copy(self, input_path: str, output_format: str, options: Dict) -> bool:
+        """
+        같은 포맷 변환에서 원본 파일을 그대로 복사해도 되는지 확인합니다.
+        
+        색 관리를 끈 같은 포맷 변환은 톤 매핑과 알파 제거가 일어나지 않으므로,
+        재인코딩 요청과 색상 조정 옵션이 없고 비트 깊이도 그대로일 때만 복사합니다.
+        """
+        if options.get("reencode", False):
+            return False
+        if any(float(options.get(key, 0.0)) != 0.0 for key in _PIXEL_ADJUST_OPTIONS):
+            return False
+            
+        # 헤더만 읽어 대상 포맷의 비트 깊이로 바뀌는지 확인 (예: 16비트 PNG → 8비트)
+        input_image = oiio.ImageInput.open(input_path)
+        if not input_image:
+            return False
+        try:
+            spec = input_image.spec()
+            return adjust_bit_depth(spec, output_format) is spec
+        finally:
+            input_image.close()
+    
     def _apply_color_adjustments(self, pixels: np.ndarray, metadata: Dict, 
                               input_format: str, output_format: str, 
                               options: Dict) -> np.ndarray:
@@ -472,16 +543,73 @@ class EnhancedConverter(BaseConverter):
             self.logger.debug("톤 매핑 적용 중...")
             exposure = settings.get("exposure", 1.0)
             gamma = settings.get("gamma", 2.2)
-            result = ImageFormatUtils.apply_tone_mapping(result, exposure, gamma)
+            result = apply_tone_mapping(result, exposure, gamma)
             
         # 알파 채널 제거
         if settings.get("remove_alpha") and result.shape[2] == 4:
             self.logger.debug("알파 채널 제거 중...")
             bg_color = settings.get("background_color", (1, 1, 1))
-            result = ImageFormatUtils.remove_alpha_channel(result, bg_color)
+            result = remove_alpha_channel(result, bg_color)
             
         return result
     
+    def _stream_output_image(self, input_image, spec: oiio.ImageSpec, output_format: str,
+                            output_path: str, settings: Dict[str, Any]) -> bool:
+        """
+        입력 이미지를 스캔라인 청크 단위로 읽어 출력 이미지로 저장합니다.
+        
+        Args:
+            input_image: 열린 입력 이미지
+            spec: 입력 이미지 스펙
+            output_format: 출력 포맷 이름
+            output_path: 출력 경로
+            settings: 후처리 설정
+            
+        Returns:
+            성공 여부 (취소나 실패 시 중간까지 쓴 출력 파일은 삭제)
+        """
+        output_spec = adjust_bit_depth(spec, output_format)
+        self._apply_compression_attributes(output_spec, settings)
+        
+        output_image = oiio.ImageOutput.create(output_path)
+        if not output_image:
+            self.logger.error(f"출력 이미지를 생성할 수 없습니다: {output_path}")
+            return False
+            
+        success = False
+        try:
+            if not output_image.open(output_path, output_spec):
+                self.logger.error(f"출력 파일을 열 수 없습니다: {output_path}")
+                return False
+            success = self._copy_scanlines(
+                input_image, output_image, spec,
+                progress=lambda fraction: self._report_progress(
+                    ConversionStage.SAVE, fraction, message="이미지 저장 중 (스캔라인 단위)"))
+            return success
+        finally:
+            output_image.close()
+            if not success:
+                # 취소(ConversionCancelled 포함)나 실패로 중간에 끝난 파일이 정상 파일처럼 남지 않도록 삭제
+                try:
+                    os.remove(output_path)
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    self.logger.warning(f"불완전한 출력 파일 삭제 실패: {output_path} ({e})")
+    
+    @staticmethod
+    def _apply_compression_attributes(spec: oiio.ImageSpec, settings: Dict[str, Any]):
+        """후처리 설정의 압축 관련 값을 출력 스펙 속성으로 설정합니다."""
+        for key, value in settings.items():
+            if key == "quality" and isinstance(value, int):
+                spec["jpeg:quality"] = value
+            elif key == "compressionlevel" and isinstance(value, int):
+                spec["png:compressionlevel"] = value
+            elif key == "compression" and isinstance(value, str):
+                spec["compression"] = value
+            elif key == "rle" and isinstance(value, bool):
+                spec["targa:rle"] = int(value)
+    
     def _write_output_image(self, pixel_data: np.ndarray, spec: oiio.ImageSpec, 
                            output_path: str, settings: Dict[str, Any]) -> bool:
         """
@@ -498,12 +626,11 @@ class EnhancedConverter(BaseConverter):
         """
         output_image = None
         try:
-            # 출력 디렉토리 확인 및 생성
+            # 출력 디렉토리 확인 및 생성 (이미 있으면 그대로 사용)
             output_dir = os.path.dirname(output_path)
-            if output_dir and not os.path.exists(output_dir):
+            if output_dir:
                 try:
-                    os.makedirs(output_dir)
-                    self.logger.debug(f"출력 디렉토리 생성: {output_dir}")
+                    os.makedirs(output_dir, exist_ok=True)
                 except Exception as e:
                     self.logger.error(f"출력 디렉토리 생성 실패: {str(e)}")
                     return False
@@ -560,7 +687,8 @@ class EnhancedConverter(BaseConverter):
                                 # HDR로 저장
                                 success = output_buf.write(output_path)
                                 
-                                # 임시 파일 삭제
+                                # 임시 파일의 공유 캐시 데이터 해제 후 삭제
+                                self._image_cache.invalidate(temp_exr_path)
                                 try:
                                     os.remove(temp_exr_path)
                                 except:
@@ -587,15 +715,7 @@ class EnhancedConverter(BaseConverter):
                     return False
                 
                 # 압축 관련 속성 설정
-                for key, value in settings.items():
-                    if key == "quality" and isinstance(value, int):
-                        spec["jpeg:quality"] = value
-                    elif key == "compressionlevel" and isinstance(value, int):
-                        spec["png:compressionlevel"] = value
-                    elif key == "compression" and isinstance(value, str):
-                        spec["compression"] = value
-                    elif key == "rle" and isinstance(value, bool):
-                        spec["targa:rle"] = int(value)
+                self._apply_compression_attributes(spec, settings)
                     
                 # 이미지 쓰기
                 if output_image.open(output_path, spec):
@@ -668,6 +788,7 @@ class EnhancedConverter(BaseConverter):
                 is_hdr = format_name in ["EXR"] or bit_depth > 8
                 
                 # 기본 정보
+                file_size = os.path.getsize(image_path)
                 info = {
                     "width": spec.width,
                     "height": spec.height,
@@ -676,7 +797,8 @@ class EnhancedConverter(BaseConverter):
                     "bit_depth": bit_depth,
                     "is_hdr": is_hdr,
                     "color_profile": profile_name,
-                    "file_size": os.path.getsize(image_path)
+                    "file_size": file_size,
+                    "file_size_display": format_file_size(file_size)
                 }
                 
                 # 추가 메타데이터
@@ -1,8 +1,16 @@
 import OpenImageIO as oiio
 import os
+import shutil
 from typing import Dict, List, Tuple, Any
 from src.converters.base_converter import BaseConverter
 from src.utils.debug.debug_utils import get_detailed_error_info, format_error_for_log
+from src.utils.file_utils import format_file_size
+
+# 같은 포맷으로 취급할 확장자 별칭
+_EXT_ALIASES = {
+    '.jpeg': '.jpg',
+    '.tiff': '.tif'
+}
 
 class OIIOConverter(BaseConverter):
     """OpenImageIO 라이브러리를 사용한 이미지 변환기"""
@@ -24,13 +32,14 @@ class OIIOConverter(BaseConverter):
         self.logger.debug(f"지원되는 포맷 목록: {formats}")
         return formats
     
-    def convert_image(self, input_path: str, output_path: str) -> Tuple[bool, str, Dict[str, Any]]:
+    def convert_image(self, input_path: str, output_path: str, reencode: bool = False) -> Tuple[bool, str, Dict[str, Any]]:
         """
         이미지를 변환합니다.
         
         Args:
             input_path: 입력 이미지 경로
             output_path: 출력 이미지 경로
+            reencode: 입출력 포맷이 같아도 다시 인코딩할지 여부
             
         Returns:
             (성공 여부, 메시지, 추가 정보) 튜플
@@ -49,15 +58,24 @@ class OIIOConverter(BaseConverter):
                 
             # 출력 디렉토리 생성
             output_dir = os.path.dirname(output_path)
-            if output_dir and not os.path.exists(output_dir):
+            if output_dir:
                 try:
-                    os.makedirs(output_dir)
+                    os.makedirs(output_dir, exist_ok=True)
                 except Exception as e:
                     error_info = get_detailed_error_info(e)
                     error_msg = f"출력 디렉토리 생성 실패: {error_info['message']}"
                     self.logger.error(format_error_for_log(error_info))
                     return False, error_msg, {"error_info": error_info}
             
+            # 입출력 포맷이 같으면 디코딩/인코딩 없이 파일 복사
+            src_ext = os.path.splitext(input_path)[1].lower()
+            dst_ext = os.path.splitext(output_path)[1].lower()
+            if not reencode and _EXT_ALIASES.get(src_ext, src_ext) == _EXT_ALIASES.get(dst_ext, dst_ext):
+                if os.path.abspath(input_path) != os.path.abspath(output_path):
+                    shutil.copyfile(input_path, output_path)
+                self.logger.info(f"동일 포맷 파일 복사 완료: {output_path}")
+                return True, "동일 포맷이므로 파일을 복사했습니다.", {"copied": True}
+            
             # 입력 이미지 열기
             input_image = oiio.ImageInput.open(input_path)
             if not input_image:
@@ -88,17 +106,23 @@ class OIIOConverter(BaseConverter):
                 self.logger.error(f"OIIO 에러 상세: {error_details}")
                 return False, error_msg, debug_info
             
-            # 이미지 복사 및 변환
-            pixels = input_image.read_image()
-            if pixels is None:
-                error_msg = "이미지 데이터를 읽을 수 없습니다."
-                self.logger.error(error_msg)
-                error_details = oiio.geterror()
-                debug_info = {"oiio_error": error_details}
-                self.logger.error(f"OIIO 에러 상세: {error_details}")
-                return False, error_msg, debug_info
-                
-            success = output_image.open(output_path, spec) and output_image.write_image(pixels)
+            if self._is_large_scanline_image(spec):
+                # 대용량 스캔라인 이미지는 청크 단위로 복사하여 최대 메모리 사용량 제한
+                self.logger.debug(f"스캔라인 청크 변환 사용: {spec.image_bytes()} bytes")
+                success = output_image.open(output_path, spec) and \
+                          self._copy_scanlines(input_image, output_image, spec)
+            else:
+                # 이미지 복사 및 변환 (원본 픽셀 타입으로 읽어 float 승격 버퍼 할당을 피함)
+                pixels = input_image.read_image(spec.format)
+                if pixels is None:
+                    error_msg = "이미지 데이터를 읽을 수 없습니다."
+                    self.logger.error(error_msg)
+                    error_details = oiio.geterror()
+                    debug_info = {"oiio_error": error_details}
+                    self.logger.error(f"OIIO 에러 상세: {error_details}")
+                    return False, error_msg, debug_info
+                    
+                success = output_image.open(output_path, spec) and output_image.write_image(pixels)
             
             if success:
                 self.logger.info(f"이미지 변환 완료: {output_path}")
@@ -169,17 +193,14 @@ class OIIOConverter(BaseConverter):
                 "format": str(spec.format),
                 "file_size_bytes": file_size,
                 "file_size_mb": file_size_mb,
+                "file_size_display": format_file_size(file_size),
                 "file_extension": os.path.splitext(image_path)[1].lower()
             }
             
             # 추가 메타데이터 정보 수집
-            metadata = {}
-            for i in range(len(spec.extra_attribs)):
-                attr = spec.extra_attribs[i]
-                metadata[attr.name] = attr.value
-                
-            if metadata:
-                info["metadata"] = metadata
+            attribs = spec.extra_attribs
+            if attribs:
+                info["metadata"] = {attr.name: attr.value for attr in attribs}
             
             self.logger.debug(f"이미지 정보: {info}")
             return info
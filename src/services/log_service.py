@@ -15,14 +15,17 @@ class LogService:
         self.logger = logging.getLogger('ImageConverter')
         self.logger.setLevel(logging.DEBUG)
         
+        # 모듈 재로드 등으로 이미 핸들러가 등록된 경우 중복 추가 방지
+        if self.logger.handlers:
+            return
+        
         # 로그 디렉토리 생성
         log_dir = 'logs'
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
+        os.makedirs(log_dir, exist_ok=True)
             
-        # 파일 핸들러 설정
+        # 파일 핸들러 설정 (첫 로그 기록 시점에 파일을 엶)
         current_time = datetime.now().strftime('%Y%m%d')
-        file_handler = logging.FileHandler(f'{log_dir}/converter_{current_time}.log')
+        file_handler = logging.FileHandler(f'{log_dir}/converter_{current_time}.log', delay=True)
         file_handler.setLevel(logging.DEBUG)
         
         # 콘솔 핸들러 설정
@@ -50,5 +53,9 @@ class LogService:
     def error(self, message):
         self.logger.error(message)
     
+    def exception(self, message):
+        """현재 처리 중인 예외의 트레이스백을 포함하여 오류를 기록합니다."""
+        self.logger.exception(message)
+    
     def critical(self, message):
         self.logger.critical(message) 
\ No newline at end of file
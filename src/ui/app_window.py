@@ -1,7 +1,12 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import os
-from typing import Dict, Any
+import stat
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict
 from ..converter import ImageConverter
 from ..services.log_service import LogService
 from ..config.config_manager import ConfigManager
@@ -10,10 +15,38 @@ from .widgets.image_info_display import ImageInfoDisplay
 from .widgets.format_options_widget import FormatOptionsWidget
 from .widgets.batch_progress import BatchProgressWidget
 from src.converters.batch_service import BatchService
-from tkinterdnd2 import DND_FILES, TkinterDnD
-from src.color_management import ColorManager
+from src.converters.enhanced_converter import ConversionCancelled, ConversionStage
 from .widgets.conversion_progress import ConversionProgressWidget
 
+# 입력 파일 선택 다이얼로그의 파일 형식 필터
+_INPUT_FILETYPES = (("이미지 파일", "*.png *.jpg *.jpeg *.tif *.tiff *.exr *.tga"),)
+
+# ttk 스타일 설정 (스타일 이름 -> 옵션)
+_STYLE_OPTIONS = {
+    'TLabelframe': {'borderwidth': 2},                 # 레이블 프레임
+    'TFrame': {'borderwidth': 0},                      # 프레임
+    'Primary.TButton': {'font': ('', 10, 'bold')},     # 주요 버튼
+    'TProgressbar': {'thickness': 10},                 # 프로그레스바
+}
+
+# 진행 상황 보고를 모아서 UI에 반영하는 간격 (ms)
+_PROGRESS_FLUSH_MS = 50
+
+# 이미지 정보 캐시 최대 항목 수
+_INFO_CACHE_SIZE = 64
+
+# 경로 상태(os.stat) 캐시 유지 시간 (초)
+_STAT_CACHE_TTL = 0.2
+
+# 배치 변환 전 출력 폴더의 기존 파일 수를 세는 상한
+_EXISTING_FILE_COUNT_LIMIT = 100
+
+# 경로 변경에 따른 설정 파일 저장 지연 시간 (ms)
+_CONFIG_FLUSH_MS = 500
+
+# 출력 포맷 변경 후 변환 옵션 갱신 지연 시간 (ms)
+_FORMAT_OPTIONS_DEBOUNCE_MS = 50
+
 class AppWindow:
     def __init__(self):
         self.window = None
@@ -21,6 +54,46 @@ class AppWindow:
         self.logger = LogService()
         self.config = ConfigManager()
         self.batch_service = BatchService()
+        
+        # 확장자 -> 포맷 이름 역방향 조회 테이블 (지원 포맷은 실행 중 변하지 않음)
+        self._ext_to_format = {ext.lower(): name for name, ext in self.converter.supported_formats.items()}
+        
+        # 확장자 비교용 튜플 (긴 확장자를 먼저 비교)
+        self._exts_sorted = tuple(sorted(self._ext_to_format, key=len, reverse=True))
+        
+        # 출력 형식 콤보박스에 표시할 포맷 이름 목록
+        self._supported_format_names = tuple(self.converter.get_supported_formats())
+        
+        # 한 번의 사용자 동작 동안 반복되는 stat 호출을 줄이기 위한 캐시 (경로 -> (시각, stat 결과))
+        self._stat_cache = {}
+        
+        # 마지막으로 처리한 입력/출력 경로 상태 (같은 경로 재선택 시 중복 처리 방지)
+        self._last_input_signature = None
+        self._last_output_signature = None
+        
+        # 지연된 설정 저장 예약 ID
+        self._config_flush_id = None
+        
+        # 지연된 변환 옵션 갱신 예약 ID
+        self._fmt_after_id = None
+        
+        # 이미지 정보 캐시 ((절대 경로, 크기, 수정 시각) -> 정보, LRU)
+        self._info_cache = OrderedDict()
+        
+        # 단일 파일 변환 작업용 워커 스레드 (UI 스레드 블로킹 방지)
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._single_future = None
+        self._cancel_flag = threading.Event()
+        
+        # 창이 닫힌 뒤에는 워커 스레드가 파괴된 루트에 after를 호출하지 않도록 표시
+        self._closed = False
+        
+        # 워커 스레드의 진행 상황 보고를 모아 두었다가 한 번에 반영하기 위한 상태
+        self._progress_lock = threading.Lock()
+        self._stage_pending = {}
+        self._stage_flush_scheduled = False
+        self._batch_pending = None
+        self._batch_flush_scheduled = False
         self.logger.info("UI 초기화")
         
     def create_window(self):
@@ -28,6 +101,8 @@ class AppWindow:
         self.logger.debug("메인 윈도우 생성 시작")
         
         # 메인 윈도우 설정
+        # 드래그 앤 드롭 지원 루트 윈도우 (창을 만들 때만 필요하므로 여기서 가져옴)
+        from tkinterdnd2 import TkinterDnD
         self.window = TkinterDnD.Tk()
         self.window.title("이미지 포맷 변환기")
         self.window.geometry("1024x768")
@@ -49,22 +124,23 @@ class AppWindow:
         # 스타일 설정
         self._setup_styles()
         
+        # 창 닫기 시 리소스 정리
+        self.window.protocol("WM_DELETE_WINDOW", self._on_close)
+        
         self.logger.debug("메인 윈도우 생성 완료")
         
     def _setup_styles(self):
         """애플리케이션 스타일을 설정합니다."""
-        # 기본 테마 설정
-        style = ttk.Style()
-        
-        # 프레임과 레이블 프레임 스타일 설정
-        style.configure('TLabelframe', borderwidth=2)
-        style.configure('TFrame', borderwidth=0)
-        
-        # 버튼 스타일 설정
-        style.configure('Primary.TButton', font=('', 10, 'bold'))
-        
-        # 프로그레스바 스타일 설정
-        style.configure('TProgressbar', thickness=10)
+        # 스타일은 Tcl 인터프리터(루트 윈도우) 단위로 유지되므로 한 번만 설정
+        if getattr(self.window, "_styles_done", False):
+            return
+            
+        # 기본 테마 설정 (스타일 이름마다 configure 한 번)
+        style = ttk.Style(self.window)
+        for style_name, options in _STYLE_OPTIONS.items():
+            style.configure(style_name, **options)
+            
+        self.window._styles_done = True
         
     def _setup_ui(self):
         """UI 요소들을 설정합니다."""
@@ -80,6 +156,10 @@ class AppWindow:
         left_panel = ttk.Frame(main_paned)
         main_paned.add(left_panel, weight=1)
         
+        # 배치 진행 상태 위젯은 배치 모드로 처음 전환될 때 생성
+        self._left_panel = left_panel
+        self.batch_progress = None
+        
         # 입력 경로 선택
         input_frame = ttk.LabelFrame(left_panel, text="입력", padding=10)
         input_frame.pack(fill="x", pady=(0, 5))
@@ -129,10 +209,9 @@ class AppWindow:
         self.convert_button.pack(side="right", padx=(5, 0))
         
         # 출력 파일 포맷 설정
-        supported_formats = self.converter.get_supported_formats()
-        format_combo["values"] = supported_formats
+        format_combo["values"] = self._supported_format_names
         
-        if supported_formats:
+        if self._supported_format_names:
             format_combo.current(0)
         
         # 포맷 변경 이벤트 핸들러
@@ -140,7 +219,7 @@ class AppWindow:
             # 출력 경로 확장자 업데이트
             output_path = self.output_entry.get_path()
             
-            if output_path and not os.path.isdir(output_path):
+            if output_path and not self._is_dir(output_path):
                 # 현재 선택된 형식
                 selected_format = self.format_var.get()
                 
@@ -155,17 +234,14 @@ class AppWindow:
                     new_path = f"{base_path}{new_ext}"
                     self.output_entry.set_path(new_path)
             
-            # 포맷에 따른 옵션 업데이트
-            self._update_format_options(self.input_entry.get_path())
+            # 포맷에 따른 옵션 업데이트 (연속 변경 시 마지막 한 번만 수행)
+            if self._fmt_after_id is not None:
+                self.window.after_cancel(self._fmt_after_id)
+            self._fmt_after_id = self.window.after(_FORMAT_OPTIONS_DEBOUNCE_MS,
+                                                   self._do_update_format_options)
         
         self.format_var.trace_add("write", _on_format_change)
         
-        # 배치 처리 진행 상태 위젯 (초기에는 숨김)
-        self.batch_progress = BatchProgressWidget(left_panel)
-        self.batch_progress.pack(fill="x", expand=True, pady=(10, 0))
-        self.batch_progress.pack_forget()
-        self.batch_progress.set_cancel_callback(self._cancel_batch_conversion)
-        
         # 오른쪽 패널 (이미지 정보)
         right_panel = ttk.Frame(main_paned)
         main_paned.add(right_panel, weight=1)
@@ -194,16 +270,25 @@ class AppWindow:
         if mode == "single":
             # 단일 파일 모드
             self.work_mode_var.set("single")
-            self.batch_progress.pack_forget()
+            if self.batch_progress is not None:
+                self.batch_progress.pack_forget()
             self.single_progress_container.pack(fill="x", pady=(10, 0))
         else:
             # 배치 모드
             self.work_mode_var.set("batch")
             self.single_progress_container.pack_forget()
+            if self.batch_progress is None:
+                # 배치 처리 진행 상태 위젯 (처음 사용할 때 생성)
+                self.batch_progress = BatchProgressWidget(self._left_panel)
+                self.batch_progress.set_cancel_callback(self._cancel_batch_conversion)
             self.batch_progress.pack(fill="x", expand=True, pady=(10, 0))
             
     def _update_ui_state(self):
         """입력 경로 변경에 따라 UI 상태를 업데이트합니다."""
+        # 단일 파일 변환 중에는 변환 버튼이 취소 버튼으로 사용되므로 그대로 유지
+        if self._single_future is not None:
+            return
+            
         input_path = self.input_entry.get_path()
         output_path = self.output_entry.get_path()
         
@@ -213,14 +298,16 @@ class AppWindow:
             return
             
         # 입력 경로의 유효성 확인
-        if not os.path.exists(input_path):
+        input_stat = self._stat(input_path)
+        if input_stat is None:
             self.convert_button.configure(state="disabled")
             return
+        is_dir = stat.S_ISDIR(input_stat.st_mode)
             
         # 출력 경로가 디렉토리인 경우 해당 디렉토리가 있는지 확인
-        if os.path.isdir(input_path):
+        if is_dir:
             # 입력이 디렉토리인 경우, 출력은 반드시 디렉토리여야 함
-            if os.path.exists(output_path) and not os.path.isdir(output_path):
+            if self._is_existing_file(output_path):
                 self.convert_button.configure(state="disabled")
                 return
         
@@ -228,7 +315,6 @@ class AppWindow:
         self.convert_button.configure(state="normal")
         
         # 경로 유형에 따른 UI 모드 전환
-        is_dir = os.path.isdir(input_path)
         if is_dir:
             self._switch_to_mode("batch")
         else:
@@ -239,20 +325,27 @@ class AppWindow:
         if not path:
             return
             
-        if os.path.exists(path):
+        # 같은 경로가 변경 없이 다시 선택된 경우 무시
+        path_stat = self._stat(path)
+        signature = self._path_signature(path, path_stat)
+        if signature == self._last_input_signature:
+            return
+        self._last_input_signature = signature
+        
+        if path_stat is not None:
             # 경로 유형에 따라 UI 상태 변경
-            if os.path.isdir(path):
+            if stat.S_ISDIR(path_stat.st_mode):
                 # 디렉토리인 경우
                 self._switch_to_mode("batch")
-                self.config.set("last_input_directory", path)
+                self._set_config_deferred("last_input_directory", path)
                 
                 # 폴더 내 이미지 파일 확인하여 변환 옵션 업데이트
                 self._update_format_options_for_directory(path)
             else:
                 # 파일인 경우
                 self._switch_to_mode("single")
-                self.config.set("last_input_file", path)
-                self.config.set("last_input_directory", os.path.dirname(path))
+                self._set_config_deferred("last_input_file", path)
+                self._set_config_deferred("last_input_directory", os.path.dirname(path))
                 
                 # 이미지 정보 업데이트 및 포맷 옵션 설정
                 self.update_image_info(path)
@@ -268,70 +361,81 @@ class AppWindow:
         """디렉토리 내 이미지 파일을 확인하고 변환 옵션을 업데이트합니다."""
         self.logger.debug(f"디렉토리 변환 옵션 업데이트: {directory_path}")
         
-        # 디렉토리 내 이미지 파일 확장자 확인
-        image_extensions = set()
-        supported_exts = set()
-        
-        # 지원 확장자 목록
-        for ext in self.converter.supported_formats.values():
-            supported_exts.add(ext.lower())
-        
         # 디렉토리 내 파일 순회
         for root, _, files in os.walk(directory_path):
             for file in files:
-                ext = os.path.splitext(file)[1].lower()
-                if ext in supported_exts:
-                    image_extensions.add(ext)
-                    
+                if file.lower().endswith(self._exts_sorted):
                     # 하나의 이미지 파일을 찾으면 해당 파일로 변환 옵션 업데이트
                     file_path = os.path.join(root, file)
                     self._update_format_options(file_path)
                     return  # 첫 번째 발견된 이미지 파일로 옵션 설정
                     
         # 지원되는 이미지 파일을 못 찾은 경우
-        if not image_extensions:
-            self.logger.warning(f"디렉토리에 지원 가능한 이미지 파일이 없습니다: {directory_path}")
-            # 기본 옵션으로 설정하고 비활성화
-            self.format_options.update_for_formats(None, self.format_var.get(), {})
-            self.format_options.set_enabled(False)
+        self.logger.warning(f"디렉토리에 지원 가능한 이미지 파일이 없습니다: {directory_path}")
+        # 기본 옵션으로 설정하고 비활성화
+        self.format_options.update_for_formats(None, self.format_var.get(), {})
+        self.format_options.set_enabled(False)
             
-    def _check_output_path_exists(self):
-        """출력 경로의 파일 존재 여부를 확인하고 경고를 표시합니다."""
+    def _check_output_path_exists(self) -> bool:
+        """출력 경로의 파일 존재 여부를 확인하고 경고를 표시합니다. 존재 여부를 반환합니다."""
         output_path = self.output_entry.get_path()
-        if output_path and os.path.exists(output_path) and not os.path.isdir(output_path):
-            self.output_entry.set_existing_file_warning(True)
-        else:
-            self.output_entry.set_existing_file_warning(False)
+        exists = bool(output_path) and self._is_existing_file(output_path)
+        self.output_entry.set_existing_file_warning(exists)
+        return exists
         
     def _on_output_path_change(self, path: str):
         """출력 경로가 변경되었을 때 호출됩니다."""
         if not path:
             return
             
+        # 같은 경로가 변경 없이 다시 선택된 경우 무시
+        path_stat = self._stat(path)
+        signature = self._path_signature(path, path_stat)
+        if signature == self._last_output_signature:
+            return
+        self._last_output_signature = signature
+        
         # 경로 유형에 따라 설정 저장
-        if os.path.isdir(path):
-            self.config.set("last_output_directory", path)
+        if path_stat is not None and stat.S_ISDIR(path_stat.st_mode):
+            self._set_config_deferred("last_output_directory", path)
         else:
             # 파일이 이미 존재하는지 확인
-            if os.path.exists(path) and not os.path.isdir(path):
+            if self._check_output_path_exists():
                 self.logger.debug(f"출력 파일이 이미 존재함: {path}")
-                self.output_entry.set_existing_file_warning(True)
-            else:
-                self.output_entry.set_existing_file_warning(False)
             
-            self.config.set("last_output_file", path)
-            self.config.set("last_output_directory", os.path.dirname(path))
+            self._set_config_deferred("last_output_file", path)
+            self._set_config_deferred("last_output_directory", os.path.dirname(path))
             
         # UI 상태 업데이트
         self._update_ui_state()
         
+    def _set_config_deferred(self, key: str, value: Any):
+        """설정 값을 메모리에 반영하고, 파일 저장은 잠시 뒤 한 번에 수행합니다."""
+        self.config.set_deferred(key, value)
+        if self._config_flush_id is None:
+            self._config_flush_id = self.window.after(_CONFIG_FLUSH_MS, self._flush_config)
+            
+    def _flush_config(self):
+        """지연된 설정 변경 사항을 파일에 저장합니다."""
+        self._config_flush_id = None
+        self.config.flush()
+        
+    @staticmethod
+    def _path_signature(path: str, path_stat) -> tuple:
+        """경로와 stat 결과로 경로 상태 비교용 값을 만듭니다."""
+        if path_stat is None:
+            return (path, None)
+        return (path, path_stat.st_mode, path_stat.st_size, path_stat.st_mtime_ns)
+        
     def _on_clear_input_path(self):
         """입력 경로 초기화 시 호출됩니다."""
+        self._last_input_signature = None
         self.info_display.clear()
         self._update_ui_state()
         
     def _on_clear_output_path(self):
         """출력 경로 초기화 시 호출됩니다."""
+        self._last_output_signature = None
         self._update_ui_state()
         
     def select_input_path(self):
@@ -340,7 +444,7 @@ class AppWindow:
         
         # 저장된 마지막 디렉토리 불러오기
         last_dir = self.config.get("last_input_directory")
-        if not last_dir or not os.path.exists(last_dir):
+        if not last_dir or self._stat(last_dir) is None:
             last_dir = os.path.expanduser("~")
             
         # 파일 또는 폴더 선택을 묻는 대화상자
@@ -359,7 +463,7 @@ class AppWindow:
             file_path = filedialog.askopenfilename(
                 title="입력 이미지 선택",
                 initialdir=last_dir,
-                filetypes=[("이미지 파일", "*.png *.jpg *.jpeg *.tif *.tiff *.exr *.tga")]
+                filetypes=_INPUT_FILETYPES
             )
             if file_path:
                 self.input_entry.set_path(file_path)
@@ -375,13 +479,14 @@ class AppWindow:
     def select_output_path(self):
         """출력 경로를 선택합니다."""
         input_path = self.input_entry.get_path()
+        input_is_dir = self.input_entry.is_directory_path()
         
         if not input_path:
             self.logger.warning("입력 경로가 선택되지 않은 상태에서 출력 경로 선택 시도")
             messagebox.showerror("오류", "먼저 입력 경로를 선택해주세요.")
             return
             
-        if not self.format_var.get() and not self.input_entry.is_directory_path():
+        if not self.format_var.get() and not input_is_dir:
             self.logger.warning("출력 포맷이 선택되지 않은 상태에서 출력 경로 선택 시도")
             messagebox.showerror("오류", "출력 포맷을 선택해주세요.")
             return
@@ -390,13 +495,13 @@ class AppWindow:
         
         # 저장된 마지막 디렉토리 불러오기
         last_dir = self.config.get("last_output_directory")
-        if not last_dir or not os.path.exists(last_dir):
-            if os.path.isdir(input_path):
+        if not last_dir or self._stat(last_dir) is None:
+            if self._is_dir(input_path):
                 last_dir = input_path
             else:
                 last_dir = os.path.dirname(input_path)
                 
-        if self.input_entry.is_directory_path():
+        if input_is_dir:
             # 입력이 폴더인 경우 - 폴더 선택 다이얼로그
             folder_path = filedialog.askdirectory(
                 title="출력 폴더 선택",
@@ -422,39 +527,83 @@ class AppWindow:
                 
                 # 최종 출력 경로: 선택한 폴더 + 입력 파일명 + 확장자
                 output_path = os.path.join(folder_path, f"{input_filename}{output_ext}")
+                # 파일 존재 여부 경고는 경로 변경 처리(_on_output_path_change)에서 표시
                 self.output_entry.set_path(output_path)
                 
-                # 파일 존재 여부 확인하여 경고 표시
-                if os.path.exists(output_path) and not os.path.isdir(output_path):
-                    self.output_entry.set_existing_file_warning(True)
-                    self.logger.debug(f"출력 파일이 이미 존재함: {output_path}")
-                else:
-                    self.output_entry.set_existing_file_warning(False)
-                
                 # 출력 포맷 저장
                 self.config.set("last_output_format", self.format_var.get())
             
+    def _stat(self, path: str):
+        """경로의 os.stat 결과를 반환합니다. 존재하지 않으면 None (짧은 시간 동안 캐시)."""
+        now = time.monotonic()
+        cached = self._stat_cache.get(path)
+        if cached and now - cached[0] < _STAT_CACHE_TTL:
+            return cached[1]
+            
+        try:
+            result = os.stat(path)
+        except OSError:
+            result = None
+            
+        # 오래된 항목이 계속 쌓이지 않도록 일정 크기를 넘으면 비움
+        if len(self._stat_cache) > 256:
+            self._stat_cache.clear()
+        self._stat_cache[path] = (now, result)
+        return result
+        
+    def _is_dir(self, path: str) -> bool:
+        """경로가 존재하는 디렉토리인지 확인합니다."""
+        st = self._stat(path)
+        return st is not None and stat.S_ISDIR(st.st_mode)
+        
+    def _is_existing_file(self, path: str) -> bool:
+        """경로가 존재하며 디렉토리가 아닌지 확인합니다."""
+        st = self._stat(path)
+        return st is not None and not stat.S_ISDIR(st.st_mode)
+        
     def update_image_info(self, image_path: str):
         """이미지 정보를 업데이트합니다."""
         self.logger.debug(f"이미지 정보 업데이트: {image_path}")
-        info = self.converter.get_image_info(image_path)
+        
+        st = self._stat(image_path)
+        key = (os.path.abspath(image_path), st.st_size, st.st_mtime) if st else None
+            
+        info = self._info_cache.get(key) if key else None
+        if info is not None:
+            self._info_cache.move_to_end(key)
+        else:
+            info = self.converter.get_image_info(image_path)
+            
+            # 오류 결과는 캐시하지 않음
+            if key and "error" not in info:
+                self._info_cache[key] = info
+                if len(self._info_cache) > _INFO_CACHE_SIZE:
+                    self._info_cache.popitem(last=False)
+                    
         self.info_display.update_info(info)
         
+    def _format_from_path(self, path: str):
+        """경로의 확장자로 포맷 이름을 반환합니다. 지원하지 않는 확장자이면 None."""
+        path_lower = path.lower()
+        for ext in self._exts_sorted:
+            if path_lower.endswith(ext):
+                return self._ext_to_format[ext]
+        return None
+        
+    def _do_update_format_options(self):
+        """예약된 변환 옵션 갱신을 현재 입력 경로 기준으로 수행합니다."""
+        self._fmt_after_id = None
+        self._update_format_options(self.input_entry.get_path())
+        
     def _update_format_options(self, input_path: str):
         """포맷 옵션을 업데이트합니다."""
         input_format = None
         output_format = self.format_var.get()
         
         # 입력 파일이 있고 디렉토리가 아닌 경우 포맷 결정
-        if input_path and os.path.exists(input_path) and not os.path.isdir(input_path):
-            # 입력 포맷 결정
-            input_ext = os.path.splitext(input_path)[1].lower()
-            
-            # 확장자로 포맷 유추
-            for format_name, ext in self.converter.supported_formats.items():
-                if ext.lower() == input_ext:
-                    input_format = format_name
-                    break
+        if input_path and self._is_existing_file(input_path):
+            # 확장자로 입력 포맷 유추
+            input_format = self._format_from_path(input_path)
         
         # 변환 옵션 위젯 업데이트
         if input_format and output_format:
@@ -474,6 +623,7 @@ class AppWindow:
     def convert_image(self):
         """이미지 변환을 실행합니다."""
         input_path = self.input_entry.get_path()
+        input_is_dir = self.input_entry.is_directory_path()
         output_path = self.output_entry.get_path()
         
         if not input_path or not output_path:
@@ -481,8 +631,18 @@ class AppWindow:
             messagebox.showerror("오류", "입력 경로와 출력 경로를 모두 선택해주세요.")
             return
             
+        # 이전 단일 파일 변환이 아직 진행 중이면 무시
+        if self._single_future is not None:
+            self.logger.warning("이전 변환 작업이 아직 진행 중입니다")
+            return
+            
+        # 덮어쓰기 확인은 최신 상태로 판단 (출력 경로 stat은 한 번만 조회)
+        self._stat_cache.clear()
+        output_stat = self._stat(output_path)
+        output_is_dir = output_stat is not None and stat.S_ISDIR(output_stat.st_mode)
+            
         # 파일 덮어쓰기 확인
-        if not self.input_entry.is_directory_path() and os.path.exists(output_path) and not os.path.isdir(output_path):
+        if not input_is_dir and output_stat is not None and not output_is_dir:
             if not messagebox.askyesno("확인", f"출력 파일이 이미 존재합니다:\n{output_path}\n\n덮어쓰시겠습니까?", 
                                      icon="warning"):
                 self.logger.info("사용자가 덮어쓰기를 취소함")
@@ -494,14 +654,8 @@ class AppWindow:
             conversion_options = self.format_options.get_options()
             
             # 입력/출력 포맷이 모두 있는 경우 옵션 저장
-            if not self.input_entry.is_directory_path():
-                input_path = self.input_entry.get_path()
-                input_ext = os.path.splitext(input_path)[1].lower()
-                input_format = None
-                for format_name, ext in self.converter.supported_formats.items():
-                    if ext.lower() == input_ext:
-                        input_format = format_name
-                        break
+            if not input_is_dir:
+                input_format = self._format_from_path(input_path)
                         
                 output_format = self.format_var.get()
                 
@@ -510,14 +664,21 @@ class AppWindow:
                     self.logger.debug(f"변환 옵션 저장: {input_format} -> {output_format}")
             
         # 입력이 폴더인지 파일인지에 따라 변환 방식 결정
-        if self.input_entry.is_directory_path():
+        if input_is_dir:
             # 배치 변환 전 폴더 내 파일 덮어쓰기 확인
-            if os.path.exists(output_path) and os.path.isdir(output_path):
-                # 출력 폴더가 이미 있는 경우
-                output_files = [f for f in os.listdir(output_path) if os.path.isfile(os.path.join(output_path, f))]
-                if output_files:
+            if output_is_dir:
+                # 출력 폴더가 이미 있는 경우 (파일 수는 상한까지만 셈)
+                file_count = 0
+                with os.scandir(output_path) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            file_count += 1
+                            if file_count >= _EXISTING_FILE_COUNT_LIMIT:
+                                break
+                if file_count:
+                    count_text = f"{file_count}+" if file_count >= _EXISTING_FILE_COUNT_LIMIT else str(file_count)
                     if not messagebox.askyesno("확인", 
-                                            f"출력 폴더({output_path})에 {len(output_files)}개의 파일이 있습니다. "
+                                            f"출력 폴더({output_path})에 {count_text}개의 파일이 있습니다. "
                                             f"기존 파일이 덮어쓰기될 수 있습니다.\n계속하시겠습니까?", 
                                             icon="warning"):
                         self.logger.info("사용자가 배치 변환을 취소함")
@@ -528,7 +689,7 @@ class AppWindow:
             self._convert_single(input_path, output_path, conversion_options)
             
     def _convert_single(self, input_path: str, output_path: str, options: Dict):
-        """단일 파일 변환을 실행합니다."""
+        """단일 파일 변환을 워커 스레드에서 실행합니다."""
         self.logger.info(f"단일 이미지 변환 시작: {input_path} -> {output_path}")
         
         # 배치 진행 상태 숨김, 단일 파일 진행 상태 표시
@@ -545,15 +706,47 @@ class AppWindow:
         # 상태 메시지 설정
         self.conversion_progress.set_status(f"변환 중... {input_filename}")
         
+        # 변환 중에는 변환 버튼을 취소 버튼으로 사용
+        self._cancel_flag.clear()
+        self.convert_button.configure(text="변환 취소", command=self._cancel_single, state="normal")
+        
+        # 변환기의 진행 상황 콜백 설정
+        self.converter.converter.set_progress_callback(self._on_conversion_progress)
+        
+        # 실제 변환은 워커 스레드에서 실행하고, 완료 처리는 UI 스레드로 전달
+        self._single_future = self._executor.submit(
+            self.converter.converter.convert_image, input_path, output_path, options
+        )
+        self._single_future.add_done_callback(
+            lambda future: self._schedule_on_ui(self._finish_single, future,
+                                                input_filename, output_filename)
+        )
+        
+    def _schedule_on_ui(self, callback: Callable, *args):
+        """워커 스레드에서 UI 스레드로 작업을 전달합니다 (창이 닫힌 뒤에는 무시)."""
+        if self._closed:
+            return
+        self.window.after(0, callback, *args)
+        
+    def _finish_single(self, future: Future, input_filename: str, output_filename: str):
+        """단일 파일 변환 결과를 UI 스레드에서 처리합니다."""
+        # 아직 반영되지 않은 진행 상황을 먼저 반영하여 결과 표시가 덮어써지지 않도록 함
+        self._flush_conversion_progress()
+        self._single_future = None
+        self.convert_button.configure(text="변환 시작", command=self.convert_image)
+        
+        # 변환으로 출력 파일이 생성되었으므로 캐시된 경로 상태를 버림
+        self._stat_cache.clear()
+        self._update_ui_state()
+        
         try:
-            # 변환기의 진행 상황 콜백 설정
-            self.converter.converter.set_progress_callback(self._on_conversion_progress)
-            
-            # 실제 변환 실행
-            success, message, debug_info = self.converter.converter.convert_image(input_path, output_path, options)
+            success, message, debug_info = future.result()
             
             # 변환 결과 처리
-            if success:
+            if debug_info and debug_info.get("cancelled"):
+                self.logger.info("이미지 변환 취소됨")
+                self.conversion_progress.set_status(f"변환 취소됨: {input_filename}")
+            elif success:
                 self.logger.info("이미지 변환 성공")
                 self.conversion_progress.complete()
                 self.conversion_progress.set_status(f"변환 완료: {input_filename} → {output_filename}")
@@ -570,16 +763,59 @@ class AppWindow:
                 self.conversion_progress.set_error(message)
                 messagebox.showerror("오류", f"{message}{error_details}")
                 
+        except (CancelledError, ConversionCancelled):
+            # 워커 스레드에서 시작되기 전에 취소되었거나 변환 시작 직후 취소된 경우
+            self.logger.info("이미지 변환 취소됨")
+            self.conversion_progress.set_status(f"변환 취소됨: {input_filename}")
+            
         except Exception as e:
-            import traceback
             error_msg = f"예상치 못한 오류: {str(e)}"
-            error_trace = traceback.format_exc()
-            self.logger.error(f"{error_msg}\n{error_trace}")
+            self.logger.exception(error_msg)
             self.conversion_progress.set_error(error_msg)
             messagebox.showerror("예상치 못한 오류", f"{error_msg}\n\n자세한 내용은 로그를 확인해주세요.")
     
+    def _cancel_single(self):
+        """진행 중인 단일 파일 변환을 취소합니다."""
+        if self._single_future is None:
+            return
+            
+        self._cancel_flag.set()
+        self._single_future.cancel()
+        self.convert_button.configure(state="disabled")
+        self.conversion_progress.set_status("변환 취소 중...")
+        self.logger.info("단일 파일 변환 취소 요청")
+        
     def _on_conversion_progress(self, stage: int, progress: float, info: Dict):
-        """변환기에서 보고하는 진행 상황을 UI에 반영합니다."""
+        """변환기에서 보고하는 진행 상황을 UI 스레드로 전달합니다."""
+        # 취소 요청 시 다음 진행 보고 지점에서 변환 중단 (오류 보고와 완료 단계는 제외)
+        if (self._cancel_flag.is_set() and stage != ConversionStage.COMPLETE
+                and "error" not in info):
+            raise ConversionCancelled()
+            
+        # 단계별 최신 상태만 보관 (다시 보고된 단계는 순서상 맨 뒤로 이동)
+        with self._progress_lock:
+            self._stage_pending.pop(stage, None)
+            self._stage_pending[stage] = (progress, info)
+            if self._stage_flush_scheduled:
+                return
+            self._stage_flush_scheduled = True
+            
+        # 워커 스레드에서 호출되므로 위젯 변경은 UI 스레드에서 수행
+        if not self._closed:
+            self.window.after(_PROGRESS_FLUSH_MS, self._flush_conversion_progress)
+        
+    def _flush_conversion_progress(self):
+        """모아 둔 단계별 진행 상황을 UI에 반영합니다."""
+        with self._progress_lock:
+            pending = self._stage_pending
+            self._stage_pending = {}
+            self._stage_flush_scheduled = False
+            
+        for stage, (progress, info) in pending.items():
+            self._apply_conversion_progress(stage, progress, info)
+        
+    def _apply_conversion_progress(self, stage: int, progress: float, info: Dict):
+        """변환 진행 상황을 UI에 반영합니다."""
         # 현재 단계 진행 상황 업데이트
         self.conversion_progress.update_stage(stage, progress, 
                                          info.get("message", ""), 
@@ -598,9 +834,6 @@ class AppWindow:
             stage_name = info.get("stage_name", "")
             self.conversion_progress.set_status(f"{stage_name}: {info['message']}")
         
-        # 윈도우 강제 업데이트 (UI 응답성 유지)
-        self.window.update()
-        
     def _convert_batch(self, input_folder: str, output_folder: str, options: Dict):
         """배치 변환을 실행합니다."""
         self.logger.info(f"배치 이미지 변환 시작: {input_folder} -> {output_folder}")
@@ -627,8 +860,9 @@ class AppWindow:
             messagebox.showinfo("알림", "변환할 이미지가 없습니다.")
             return
             
-        # 배치 위젯 초기화
+        # 배치 위젯 초기화 후 대기 중인 파일 목록을 미리 표시
         self.batch_progress.reset()
+        self.batch_progress.prepopulate(self.batch_service.get_pending_tasks())
         
         # 배치 변환 시작
         success = self.batch_service.start(self._update_batch_progress)
@@ -639,11 +873,26 @@ class AppWindow:
         
     def _update_batch_progress(self, completed: int, total: int, progress_info: Dict):
         """배치 변환 진행 상황을 업데이트합니다."""
-        # 배치 진행 위젯 업데이트
-        self.batch_progress.update_progress(completed, total, progress_info)
+        # 최신 상태만 보관하고, 반영 예약은 한 번만 수행
+        with self._progress_lock:
+            self._batch_pending = (completed, total, progress_info)
+            if self._batch_flush_scheduled:
+                return
+            self._batch_flush_scheduled = True
+            
+        # 배치 서비스의 모니터링 스레드에서 호출되므로 위젯 변경은 UI 스레드에서 수행
+        if not self._closed:
+            self.window.after(_PROGRESS_FLUSH_MS, self._flush_batch_progress)
         
-        # 윈도우 업데이트 (UI 응답성 유지)
-        self.window.update()
+    def _flush_batch_progress(self):
+        """모아 둔 배치 진행 상황 중 최신 상태를 UI에 반영합니다."""
+        with self._progress_lock:
+            pending = self._batch_pending
+            self._batch_pending = None
+            self._batch_flush_scheduled = False
+            
+        if pending:
+            self.batch_progress.update_progress(*pending)
         
     def _cancel_batch_conversion(self):
         """배치 변환을 취소합니다."""
@@ -667,24 +916,16 @@ class AppWindow:
             input_filename = os.path.splitext(os.path.basename(input_path))[0]
             
             # 출력 파일 확장자 결정
-            output_ext = ""
-            if self.format_var.get():
-                output_ext = self.converter.supported_formats[self.format_var.get()]
+            output_ext = self.converter.supported_formats.get(self.format_var.get(), "")
             
-            # 드롭된 것이 파일인지 폴더인지 확인
-            if os.path.isdir(path):
-                # 폴더인 경우: 폴더 경로 + 입력 파일명 + 확장자
-                output_path = os.path.join(path, f"{input_filename}{output_ext}")
-            else:
-                # 파일인 경우: 해당 파일이 위치한 폴더 경로 + 입력 파일명 + 확장자
-                folder_path = os.path.dirname(path)
-                output_path = os.path.join(folder_path, f"{input_filename}{output_ext}")
+            # 드롭된 것이 폴더이면 그 폴더, 파일이면 해당 파일이 위치한 폴더 사용
+            folder_path = path if self._is_dir(path) else os.path.dirname(path)
             
-            # 출력 경로 설정
-            self.output_entry.set_path(output_path)
+            # 폴더 경로 + 입력 파일명 + 확장자
+            output_path = os.path.join(folder_path, f"{input_filename}{output_ext}")
             
-            # 경로 설정 후 파일 존재 여부 확인
-            self._check_output_path_exists()
+            # 출력 경로 설정 (파일 존재 여부 경고는 _on_output_path_change에서 표시)
+            self.output_entry.set_path(output_path)
         else:
             # 입력이 폴더인 경우 드롭된 경로를 그대로 사용
             self.output_entry.set_path(path)
@@ -692,6 +933,38 @@ class AppWindow:
             # 폴더인 경우 기존 파일 존재 여부 확인 필요 없음
             self.output_entry.set_existing_file_warning(False)
         
+    def _on_close(self):
+        """메인 윈도우가 닫힐 때 호출됩니다."""
+        if self._closed:
+            return
+        self._closed = True
+        self._cancel_flag.set()
+        if self._single_future is not None:
+            self._single_future.cancel()
+        
+        # 아직 저장되지 않은 설정 변경 사항 저장
+        if self._config_flush_id is not None:
+            self.window.after_cancel(self._config_flush_id)
+            self._config_flush_id = None
+        self._flush_config()
+        
+        self._finish_close()
+        
+    def _finish_close(self):
+        """진행 중인 변환이 끝난 뒤 이미지 캐시를 해제하고 창을 파괴합니다."""
+        # 워커가 아직 OIIO를 사용 중이면 이벤트 루프를 유지한 채 종료될 때까지 대기
+        # (워커가 보내는 after 호출이 처리될 수 있도록 UI 스레드를 블로킹하지 않음)
+        if self._single_future is not None and not self._single_future.done():
+            self.window.after(_PROGRESS_FLUSH_MS, self._finish_close)
+            return
+        self._executor.shutdown(wait=True)
+        
+        try:
+            self.converter.release_cache()
+        except Exception as e:
+            self.logger.error(f"이미지 캐시 해제 중 오류 발생: {str(e)}")
+        self.window.destroy()
+        
     def run(self):
         """애플리케이션을 실행합니다."""
         self.logger.info("애플리케이션 실행 시작")
@@ -1,10 +1,26 @@
 import tkinter as tk
 from tkinter import ttk
 import time
+from collections import OrderedDict
 from typing import Dict, Any, List
-import os
+from .cached_vars import CachedVarMixin
 
-class BatchProgressWidget(ttk.LabelFrame):
+# 진행 상황 갱신을 모아서 화면에 반영하는 간격 (ms)
+_UPDATE_INTERVAL_MS = 75
+
+# 트리뷰에 유지하는 최대 행 수 (처리 중 + 최근 완료 20개 + 최근 실패 50개를 담을 수 있는 크기)
+_MAX_ROWS = 120
+
+# 목록에 표시하는 최근 실패 작업 수
+_MAX_FAILED_ROWS = 50
+
+# 트리뷰에서 갱신되는 컬럼 (파일명 컬럼은 생성 시에만 설정)
+_ROW_COLUMNS = ("status", "progress", "time")
+
+# 새로 만든 행의 초기 값 (상태, 진행, 처리 시간)
+_PENDING_ROW = ("대기 중", "-", "0.0초")
+
+class BatchProgressWidget(CachedVarMixin, ttk.LabelFrame):
     """배치 변환 진행 상황을 표시하는 위젯"""
     
     def __init__(self, parent, title="배치 변환 진행 상황"):
@@ -16,7 +32,17 @@ class BatchProgressWidget(ttk.LabelFrame):
             title: 프레임 제목
         """
         super().__init__(parent, text=title, padding=10)
-        self.tasks = {}  # 작업 목록
+        self._basenames = {}  # 파일 경로 -> 파일명
+        self._row_state = {}  # 파일 경로 -> 마지막으로 트리뷰에 반영한 (값, 태그)
+        self._item_rank = {}  # 아이템 ID(파일 경로) -> 정렬 순위 (처리 중 0, 실패 1, 그 외 2)
+        self._buckets = (OrderedDict(), OrderedDict(), OrderedDict())  # 정렬 순위별 아이템 ID (표시 순서, 오래된 순)
+        self._order_dirty = False  # 순위가 바뀌어 재배치가 필요한지 여부
+        self._pending_update = None  # 아직 반영하지 않은 최신 진행 상황
+        self._flush_id = None  # 예약된 반영 작업 ID
+        self._var_cache = {}  # Tk 변수 이름 -> 마지막으로 쓴 값
+        self._completed_rendered = set()  # 이미 완료로 표시한 파일 경로
+        self._failed_rendered = set()  # 이미 실패로 표시한 파일 경로
+        self._last_fingerprint = None  # 마지막으로 반영한 작업 목록의 요약값
         self.create_widgets()
         
     def create_widgets(self):
@@ -38,25 +64,14 @@ class BatchProgressWidget(ttk.LabelFrame):
         status_frame = ttk.Frame(progress_frame)
         status_frame.pack(fill="x", expand=True, pady=(5, 0))
         
-        ttk.Label(status_frame, text="상태:").pack(side="left", padx=(0, 5))
-        self.status_var = tk.StringVar(value="준비")
-        status_label = ttk.Label(status_frame, textvariable=self.status_var)
-        status_label.pack(side="left")
-        
-        ttk.Label(status_frame, text="처리중:").pack(side="left", padx=(10, 5))
-        self.processing_var = tk.StringVar(value="0")
-        processing_label = ttk.Label(status_frame, textvariable=self.processing_var)
-        processing_label.pack(side="left")
+        # 상태/처리중/완료는 하나의 문자열로 묶어 한 번에 갱신, 실패 수만 빨간색 라벨로 분리
+        self.summary_var = tk.StringVar(value=self._format_summary("준비", 0, 0, 0))
+        summary_label = ttk.Label(status_frame, textvariable=self.summary_var)
+        summary_label.pack(side="left")
         
-        ttk.Label(status_frame, text="완료:").pack(side="left", padx=(10, 5))
-        self.completed_var = tk.StringVar(value="0/0")
-        completed_label = ttk.Label(status_frame, textvariable=self.completed_var)
-        completed_label.pack(side="left")
-        
-        ttk.Label(status_frame, text="실패:").pack(side="left", padx=(10, 5))
-        self.failed_var = tk.StringVar(value="0")
+        self.failed_var = tk.StringVar(value="실패: 0")
         failed_label = ttk.Label(status_frame, textvariable=self.failed_var, foreground="red")
-        failed_label.pack(side="left")
+        failed_label.pack(side="left", padx=(10, 0))
         
         # 작업 목록 표시
         files_frame = ttk.LabelFrame(self, text="처리 파일", padding=(5, 5))
@@ -99,153 +114,237 @@ class BatchProgressWidget(ttk.LabelFrame):
         self.cancel_button = ttk.Button(button_frame, text="취소", state="disabled")
         self.cancel_button.pack(side="right")
         
+    @staticmethod
+    def _format_summary(status: str, processing: int, completed: int, total: int) -> str:
+        """상태 요약 문자열을 만듭니다."""
+        return f"상태: {status}    처리중: {processing}    완료: {completed}/{total}"
+        
     def update_progress(self, completed: int, total: int, progress_info: Dict[str, Any]):
         """
-        진행 상황을 업데이트합니다.
+        진행 상황을 업데이트합니다. 짧은 시간 내 연속 호출은 마지막 상태 한 번으로 합쳐 반영합니다.
         
         Args:
             completed: 완료된 작업 수
             total: 전체 작업 수
             progress_info: 진행 정보
         """
+        self._pending_update = (completed, total, progress_info)
+        if self._flush_id is None:
+            self._flush_id = self.after(_UPDATE_INTERVAL_MS, self._flush)
+            
+    def _flush(self):
+        """모아 둔 최신 진행 상황을 화면에 반영합니다."""
+        self._flush_id = None
+        pending = self._pending_update
+        self._pending_update = None
+        if pending:
+            self._do_update_progress(*pending)
+            
+    def _do_update_progress(self, completed: int, total: int, progress_info: Dict[str, Any]):
+        """진행 상황을 화면에 반영합니다."""
         # 진행률 계산
         percentage = (completed / total) * 100 if total > 0 else 0
-        self.total_progress_var.set(percentage)
+        self._set_if_changed(self.total_progress_var, percentage)
         
         # 상태 텍스트 업데이트
         if percentage == 100:
-            self.status_var.set("완료")
+            status_text = "완료"
             self.cancel_button.configure(state="disabled")
         else:
-            self.status_var.set(f"변환 중... ({percentage:.1f}%)")
+            status_text = f"변환 중... ({percentage:.1f}%)"
             self.cancel_button.configure(state="normal")
             
-        # 처리 상태 업데이트
-        self.completed_var.set(f"{completed}/{total}")
-        
-        # 처리중 파일 수
+        # 상태, 처리중 파일 수, 완료 수를 한 번의 갱신으로 반영
         processing_count = len(progress_info.get("processing", []))
-        self.processing_var.set(str(processing_count))
+        self._set_if_changed(self.summary_var, self._format_summary(status_text, processing_count, completed, total))
         
         # 실패 파일 수
         failed_count = len(progress_info.get("failed", []))
-        self.failed_var.set(str(failed_count))
+        self._set_if_changed(self.failed_var, f"실패: {failed_count}")
         
         # 파일 목록 업데이트
         self._update_file_list(progress_info)
         
     def _update_file_list(self, progress_info: Dict[str, Any]):
-        """파일 목록을 업데이트합니다."""
-        # 처리 중인 작업 먼저 표시
+        """파일 목록을 업데이트합니다. 값이 바뀐 행만 트리뷰에 반영합니다."""
         processing = progress_info.get("processing", [])
+        completed = progress_info.get("completed", [])
+        failed = progress_info.get("failed", [])
+        
+        # 작업 상태가 바뀌지 않았으면 목록 갱신 생략 (처리 중 작업의 경과 시간은 함께 증가하므로 마지막 작업만 비교)
+        last_processing = processing[-1] if processing else None
+        fingerprint = (
+            len(processing),
+            last_processing["input_path"] if last_processing else None,
+            last_processing.get("progress") if last_processing else None,
+            last_processing["duration_str"] if last_processing else None,
+            len(completed),
+            completed[-1]["input_path"] if completed else None,
+            len(failed)
+        )
+        if fingerprint == self._last_fingerprint:
+            return
+        self._last_fingerprint = fingerprint
+        
+        # 표시 문자열(파일명, 상태, 처리 시간)은 배치 서비스의 모니터 스레드에서 미리 만들어 전달됨
+        # 처리 중인 작업 먼저 표시
         for task_info in processing:
             file_path = task_info["input_path"]
             progress_pct = task_info.get("progress", 0)
-            item_id = self._get_or_create_item(file_path)
             
             # 진행 상태를 백분율로 표시
             progress_str = f"{progress_pct:.0f}%" if progress_pct > 0 else "처리 중"
             
-            self.files_tree.item(item_id, values=(
-                os.path.basename(file_path),
-                "처리 중",
+            self._set_row(task_info, (
+                task_info["status_text"],
                 progress_str,
-                f"{task_info['duration']:.1f}초"
-            ), tags=("processing",))
-            
-            # 툴팁으로 전체 경로 표시
-            self._set_tooltip(item_id, file_path)
+                task_info["duration_str"]
+            ), "processing", 0, file_path)
             
-        # 최근 완료된 작업 표시
-        completed = progress_info.get("completed", [])
-        for task_info in completed[-20:]:  # 최근 20개만
-            file_path = task_info["input_path"]
-            item_id = self._get_or_create_item(file_path)
-            self.files_tree.item(item_id, values=(
-                os.path.basename(file_path),
-                "완료",
+        # 최근 완료된 작업 표시 (새로 완료된 작업만, 최대 20개)
+        for task_info in self._new_tasks(completed, self._completed_rendered, 20):
+            self._set_row(task_info, (
+                task_info["status_text"],
                 "100%",
-                f"{task_info['duration']:.1f}초"
-            ), tags=("completed",))
-            
-            # 툴팁으로 전체 경로 표시
-            self._set_tooltip(item_id, file_path)
+                task_info["duration_str"]
+            ), "completed", 2, task_info["input_path"])
             
         # 실패한 작업 표시
-        failed = progress_info.get("failed", [])
-        for task_info in failed:
+        for task_info in self._new_tasks(failed, self._failed_rendered, _MAX_FAILED_ROWS):  # 전체 수는 상단에 표시
             file_path = task_info["input_path"]
             error_msg = task_info.get("error", "")
-            item_id = self._get_or_create_item(file_path)
-            
-            status_text = "실패"
-            if error_msg:
-                # 오류 메시지가 있는 경우 상태에 괄호로 표시
-                error_brief = error_msg[:15] + "..." if len(error_msg) > 15 else error_msg
-                status_text = f"실패 ({error_brief})"
-                
-            self.files_tree.item(item_id, values=(
-                os.path.basename(file_path),
-                status_text,
-                "-",
-                f"{task_info['duration']:.1f}초"
-            ), tags=("failed",))
             
             # 툴팁으로 전체 경로와 오류 메시지 표시
             tooltip_text = f"{file_path}\n오류: {error_msg}" if error_msg else file_path
-            self._set_tooltip(item_id, tooltip_text)
+            self._set_row(task_info, (
+                task_info["status_text"],
+                "-",
+                task_info["duration_str"]
+            ), "failed", 1, tooltip_text)
+            
+        # 트리뷰 정렬 (처리 중 → 실패 → 완료 순), 순위가 바뀐 항목이 있을 때만 한 번에 재배치
+        if self._order_dirty:
+            processing_items, failed_items, other_items = self._buckets
+            self.files_tree.set_children("", *processing_items, *failed_items, *other_items)
+            self._order_dirty = False
+            
+    @staticmethod
+    def _new_tasks(tasks: List[Dict[str, Any]], rendered: set, limit: int) -> List[Dict[str, Any]]:
+        """
+        뒤에 추가된 작업 중 아직 표시하지 않은 작업을 최대 limit개까지 오래된 순서로 반환합니다.
+        완료/실패 목록은 뒤에만 추가되므로 이미 표시한 작업을 만나면 검사를 멈춥니다.
+        """
+        new_tasks = []
+        for task_info in reversed(tasks):
+            file_path = task_info["input_path"]
+            if file_path in rendered or len(new_tasks) >= limit:
+                break
+            new_tasks.append(task_info)
             
-        # 트리뷰 정렬 (처리 중 → 실패 → 완료 순)
-        all_items = self.files_tree.get_children()
-        sorted_items = sorted(all_items, key=lambda item: (
-            0 if self.files_tree.item(item)["values"][1].startswith("처리 중") else 
-            (1 if self.files_tree.item(item)["values"][1].startswith("실패") else 2)
-        ))
+        for task_info in new_tasks:
+            rendered.add(task_info["input_path"])
+        new_tasks.reverse()
+        return new_tasks
         
-        for i, item in enumerate(sorted_items):
-            self.files_tree.move(item, "", i)
+    def _set_row(self, task_info: Dict[str, Any], columns: tuple, tag: str, rank: int, tooltip_text: str):
+        """트리뷰 행을 갱신합니다 (columns: 상태, 진행, 처리 시간). 마지막으로 반영한 상태와 같으면 건너뜁니다."""
+        file_path = task_info["input_path"]
+        item_id = self._get_or_create_item(file_path, task_info["basename"])
+        state = (columns, tag)
+        old_columns, old_tag = self._row_state[file_path]
+        if (old_columns, old_tag) == state:
+            return
             
+        # 바뀐 컬럼만 개별로 갱신하고, 대부분의 컬럼이 바뀐 경우에만 전체 값을 한 번에 설정
+        changed = [i for i, value in enumerate(columns) if value != old_columns[i]]
+        if len(changed) >= len(_ROW_COLUMNS):
+            self.files_tree.item(item_id, values=(self._basenames[file_path], *columns), tags=(tag,))
+        else:
+            for i in changed:
+                self.files_tree.set(item_id, _ROW_COLUMNS[i], columns[i])
+            if tag != old_tag:
+                self.files_tree.item(item_id, tags=(tag,))
+        self._row_state[file_path] = state
+        
+        # 순위가 바뀐 경우 해당 그룹의 끝으로 이동
+        old_rank = self._item_rank.get(item_id, 2)
+        if old_rank != rank:
+            del self._buckets[old_rank][item_id]
+            self._buckets[rank][item_id] = None
+            self._item_rank[item_id] = rank
+            self._order_dirty = True
+        
+        # 툴팁으로 전체 경로 표시
+        self._set_tooltip(item_id, tooltip_text)
+        
     def _set_tooltip(self, item_id, tooltip_text):
         """트리뷰 항목에 툴팁 설정 (향후 구현을 위한 준비)"""
         # 현재는 구현하지 않음 - tkinter에서 트리뷰 아이템 툴팁 구현은 복잡함
         pass
             
-    def _get_or_create_item(self, file_path: str):
-        """파일 경로에 해당하는 트리뷰 아이템을 가져오거나 생성합니다."""
-        if file_path in self.tasks:
-            return self.tasks[file_path]
-            
-        # 아이템 생성
-        item_id = self.files_tree.insert("", "end", values=(
-            os.path.basename(file_path),
-            "대기 중",
-            "-",
-            "0.0초"
-        ))
-        self.tasks[file_path] = item_id
-        
-        # 최대 표시 개수 제한
-        if len(self.tasks) > 500:  # 최대 500개 항목 유지
-            oldest = next(iter(self.tasks))
-            self.files_tree.delete(self.tasks[oldest])
-            del self.tasks[oldest]
+    def _get_or_create_item(self, file_path: str, basename: str):
+        """파일 경로에 해당하는 트리뷰 아이템을 가져오거나 생성합니다. 아이템 ID는 파일 경로입니다."""
+        if file_path in self._item_rank:
+            return file_path
+            
+        # 아이템 생성 (파일명은 보관해 두고 행 갱신 시 재사용)
+        self._basenames[file_path] = basename
+        item_id = self.files_tree.insert("", "end", iid=file_path, values=(basename, *_PENDING_ROW))
+        self._row_state[file_path] = (_PENDING_ROW, None)
+        self._item_rank[item_id] = 2
+        self._buckets[2][item_id] = None
+        
+        # 최대 표시 개수 제한 (트리뷰 레이아웃 비용은 전체 행 수에 비례)
+        if len(self._item_rank) > _MAX_ROWS:
+            self._evict_oldest_row(exclude=item_id)
             
         return item_id
         
+    def _evict_oldest_row(self, exclude):
+        """가장 오래된 행을 삭제합니다. 완료/대기 → 실패 → 처리 중 순으로 선택합니다."""
+        for bucket in reversed(self._buckets):
+            # 방금 추가한 행은 그룹의 맨 끝에 있으므로 맨 앞 항목이 그 행이면 그룹에 다른 행이 없음
+            if not bucket or next(iter(bucket)) == exclude:
+                continue
+                
+            oldest_item, _ = bucket.popitem(last=False)
+            del self._item_rank[oldest_item]
+            del self._basenames[oldest_item]
+            self._row_state.pop(oldest_item, None)
+            self.files_tree.delete(oldest_item)
+            return
+        
+    def prepopulate(self, tasks: List[Dict[str, Any]]):
+        """대기 중인 파일 행을 미리 생성합니다 (최대 표시 개수까지). tasks는 input_path, basename을 가진 작업 정보 목록입니다."""
+        for task_info in tasks[:_MAX_ROWS]:
+            self._get_or_create_item(task_info["input_path"], task_info["basename"])
+            
     def set_cancel_callback(self, callback):
         """취소 버튼 콜백 설정"""
         self.cancel_button.configure(command=callback)
         
     def reset(self):
         """위젯 상태 초기화"""
-        self.tasks = {}
-        self.total_progress_var.set(0)
-        self.status_var.set("준비")
-        self.completed_var.set("0/0")
-        self.processing_var.set("0")
-        self.failed_var.set("0")
+        # 이전 작업의 반영 대기 중인 진행 상황 취소
+        if self._flush_id is not None:
+            self.after_cancel(self._flush_id)
+            self._flush_id = None
+        self._pending_update = None
+        
+        self._basenames = {}
+        self._row_state = {}
+        self._item_rank = {}
+        self._buckets = (OrderedDict(), OrderedDict(), OrderedDict())
+        self._order_dirty = False
+        self._completed_rendered = set()
+        self._failed_rendered = set()
+        self._last_fingerprint = None
+        self._set_if_changed(self.total_progress_var, 0)
+        self._set_if_changed(self.summary_var, self._format_summary("준비", 0, 0, 0))
+        self._set_if_changed(self.failed_var, "실패: 0")
         self.cancel_button.configure(state="disabled")
         
-        # 트리뷰 항목 모두 삭제
-        for item in self.files_tree.get_children():
-            self.files_tree.delete(item) 
\ No newline at end of file
+        # 트리뷰 항목 모두 삭제 (한 번의 호출로 일괄 삭제)
+        children = self.files_tree.get_children()
+        if children:
+            self.files_tree.delete(*children) 
\ No newline at end of file
@@ -0,0 +1,17 @@
+"""
+Tk 변수 쓰기를 줄이는 위젯 공용 믹스인 모듈
+"""
+
+import tkinter as tk
+
+
+class CachedVarMixin:
+    """값이 바뀐 경우에만 Tk 변수에 쓰는 기능을 제공합니다 (사용하는 위젯은 self._var_cache = {} 로 초기화)."""
+    
+    def _set_if_changed(self, var: tk.Variable, value):
+        """값이 바뀐 경우에만 Tk 변수에 씁니다 (마지막으로 쓴 값을 보관하여 Tcl 호출 없이 비교)."""
+        key = str(var)
+        if key in self._var_cache and self._var_cache[key] == value:
+            return
+        self._var_cache[key] = value
+        var.set(value)
@@ -6,8 +6,59 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Dict, List, Any, Optional, Callable, Tuple
 import os
+from functools import lru_cache
+from .cached_vars import CachedVarMixin
 
-class ConversionProgressWidget(ttk.Frame):
+# 단계 목록 캔버스 배치 및 색상
+_STAGE_ROW_HEIGHT = 22
+_STAGE_NAME_X = 22
+_STAGE_BAR_X = 120
+_STAGE_STATUS_WIDTH = 100
+_STAGE_FONT = ("", 10)
+_STAGE_ACTIVE_FONT = ("", 10, "bold")
+_STAGE_STATUS_FONT = ("", 9)
+_STAGE_CHECK_OUTLINE = "#808080"
+_STAGE_CHECK_FILL = "#3C9A3C"
+_STAGE_BAR_OUTLINE = "#BCBCBC"
+_STAGE_BAR_TROUGH = "#E6E6E6"
+_STAGE_BAR_FILL = "#06B025"
+
+@lru_cache(maxsize=256)
+def _truncate_status(message: str, max_length: int = 50) -> str:
+    """상태 메시지가 너무 긴 경우 축약합니다 (같은 메시지는 캐시된 결과 사용)."""
+    if len(message) <= max_length:
+        return message
+        
+    # 파일 경로 형태인 경우 (파일명:파일명 패턴)
+    if " → " in message:
+        parts = message.split(" → ")
+        if len(parts) == 2:
+            # 앞부분과 뒷부분 각각 처리
+            prefix = parts[0]
+            suffix = parts[1]
+            
+            # 앞부분이 너무 길면 축약
+            if len(prefix) > max_length // 2:
+                prefix_parts = prefix.split(": ", 1)
+                if len(prefix_parts) > 1:
+                    # "변환 중..." 같은 접두사가 있으면 유지
+                    prefix = f"{prefix_parts[0]}: {os.path.basename(prefix_parts[1])}"
+                else:
+                    # 파일명만 추출
+                    prefix = os.path.basename(prefix)
+            
+            # 뒷부분이 너무 길면 축약
+            if len(suffix) > max_length // 2:
+                suffix = os.path.basename(suffix)
+                
+            # 축약된 메시지 조합
+            return f"{prefix} → {suffix}"
+        return message
+        
+    # 일반 텍스트인 경우
+    return message[:max_length-3] + "..."
+
+class ConversionProgressWidget(CachedVarMixin, ttk.Frame):
     """단일 파일 또는 배치 변환 작업의 진행 상태를 표시하는 위젯"""
     
     # 변환 단계 정의
@@ -29,6 +80,7 @@ class ConversionProgressWidget(ttk.Frame):
         self.error_message = ""
         self.is_error = False
         self.is_complete = False
+        self._var_cache = {}  # Tk 변수 이름 -> 마지막으로 쓴 값
         
         self._setup_ui()
         
@@ -65,50 +117,58 @@ class ConversionProgressWidget(ttk.Frame):
         stages_frame = ttk.LabelFrame(self, text="진행 단계", padding=(10, 5))
         stages_frame.pack(fill="x")
         
-        # 단계별 상태 항목 생성
+        # 단계별 상태는 캔버스 하나에 그림 (단계마다 위젯 4개를 만드는 대신 캔버스 아이템 사용)
+        background = ttk.Style(self).lookup("TFrame", "background") or None
+        self.stages_canvas = tk.Canvas(
+            stages_frame, height=len(self.STAGES) * _STAGE_ROW_HEIGHT,
+            highlightthickness=0, borderwidth=0, background=background
+        )
+        self.stages_canvas.pack(fill="x")
+        self.stages_canvas.bind("<Configure>", self._on_stages_resize)
+        self._canvas_width = 0
+        
+        # 단계별 캔버스 아이템 생성
         self.stage_indicators = []
         
         for i, stage_name in enumerate(self.STAGES):
-            stage_frame = ttk.Frame(stages_frame)
-            stage_frame.pack(fill="x", pady=2)
+            y = i * _STAGE_ROW_HEIGHT + _STAGE_ROW_HEIGHT // 2
             
-            # 체크박스 (완료 여부 표시)
-            check_var = tk.BooleanVar(value=False)
-            check = ttk.Checkbutton(
-                stage_frame, variable=check_var, state="disabled",
-                takefocus=False, text=""
+            # 완료 여부 표시 (완료 시 채워진 원)
+            check = self.stages_canvas.create_oval(
+                4, y - 5, 14, y + 5, outline=_STAGE_CHECK_OUTLINE, fill="", tags=("stage_check",)
             )
-            check.pack(side="left")
             
             # 단계 레이블
-            label = ttk.Label(stage_frame, text=stage_name, width=12, anchor="w")
-            label.pack(side="left", padx=(0, 5))
+            label = self.stages_canvas.create_text(
+                _STAGE_NAME_X, y, text=stage_name, anchor="w", font=_STAGE_FONT, tags=("stage_label",)
+            )
             
-            # 단계별 진행률
-            stage_progress_var = tk.DoubleVar(value=0)
-            stage_progress_bar = ttk.Progressbar(
-                stage_frame, orient="horizontal",
-                mode="determinate", variable=stage_progress_var,
-                length=100
+            # 단계별 진행률 (배경 막대 + 진행 막대, 너비는 캔버스 크기에 맞춰 배치)
+            trough = self.stages_canvas.create_rectangle(
+                _STAGE_BAR_X, y - 5, _STAGE_BAR_X, y + 5,
+                outline=_STAGE_BAR_OUTLINE, fill=_STAGE_BAR_TROUGH
+            )
+            bar = self.stages_canvas.create_rectangle(
+                _STAGE_BAR_X, y - 5, _STAGE_BAR_X, y + 5,
+                outline="", fill=_STAGE_BAR_FILL
             )
-            stage_progress_bar.pack(side="left", fill="x", expand=True)
             
             # 단계별 상태 메시지
-            stage_status_var = tk.StringVar(value="")
-            stage_status = ttk.Label(
-                stage_frame, textvariable=stage_status_var,
-                width=12, anchor="e", font=("", 9)
+            status = self.stages_canvas.create_text(
+                0, y, text="", anchor="e", font=_STAGE_STATUS_FONT, tags=("stage_status",)
             )
-            stage_status.pack(side="right")
             
-            # 단계 정보 저장
+            # 단계 정보 저장 (아이템 ID와 마지막으로 그린 상태)
             self.stage_indicators.append({
-                "check_var": check_var,
-                "progress_var": stage_progress_var,
-                "status_var": stage_status_var,
+                "y": y,
+                "check": check,
                 "label": label,
-                "progress_bar": stage_progress_bar,
-                "status": stage_status
+                "trough": trough,
+                "bar": bar,
+                "status": status,
+                "complete": False,
+                "progress": 0.0,
+                "status_text": ""
             })
         
         # 에러 메시지 프레임
@@ -124,6 +184,68 @@ class ConversionProgressWidget(ttk.Frame):
         # 초기화
         self.reset()
         
+    def _on_stages_resize(self, event):
+        """캔버스 크기가 바뀌면 진행 막대와 상태 메시지 위치를 다시 배치합니다."""
+        if event.width == self._canvas_width:
+            return
+        self._canvas_width = event.width
+        
+        canvas = self.stages_canvas
+        status_x = event.width - 4
+        for indicator in self.stage_indicators:
+            y = indicator["y"]
+            canvas.coords(indicator["trough"], _STAGE_BAR_X, y - 5, self._bar_end(), y + 5)
+            canvas.coords(indicator["status"], status_x, y)
+            self._draw_bar(indicator)
+            
+    def _bar_end(self) -> int:
+        """진행 막대의 오른쪽 끝 x 좌표"""
+        return max(_STAGE_BAR_X, self._canvas_width - _STAGE_STATUS_WIDTH)
+        
+    def _draw_bar(self, indicator: Dict[str, Any]):
+        """단계 진행 막대를 현재 진행률에 맞게 그립니다."""
+        y = indicator["y"]
+        width = (self._bar_end() - _STAGE_BAR_X) * indicator["progress"]
+        self.stages_canvas.coords(indicator["bar"], _STAGE_BAR_X, y - 5, _STAGE_BAR_X + width, y + 5)
+        
+    def _set_stage(self, indicator: Dict[str, Any], complete: bool, progress: float, status_text: str):
+        """단계 표시를 갱신합니다. 바뀐 항목만 캔버스에 반영합니다."""
+        canvas = self.stages_canvas
+        
+        if indicator["complete"] != complete:
+            indicator["complete"] = complete
+            canvas.itemconfigure(indicator["check"], fill=_STAGE_CHECK_FILL if complete else "")
+            
+        if indicator["progress"] != progress:
+            indicator["progress"] = progress
+            self._draw_bar(indicator)
+            
+        if indicator["status_text"] != status_text:
+            indicator["status_text"] = status_text
+            canvas.itemconfigure(indicator["status"], text=status_text)
+        
+    def _set_all_stages(self, complete: bool, progress: float, status_text: str):
+        """모든 단계를 같은 상태로 설정합니다. 태그와 스크립트 한 번으로 일괄 반영합니다."""
+        canvas = self.stages_canvas
+        
+        # 완료 표시와 상태 메시지는 태그로 전체 아이템을 한 번에 변경 (status_text는 고정 문구만 사용)
+        canvas.itemconfigure("stage_check", fill=_STAGE_CHECK_FILL if complete else "")
+        canvas.itemconfigure("stage_status", text=status_text)
+        
+        # 진행 막대 좌표는 단계마다 다르므로 하나의 Tcl 스크립트로 묶어 실행
+        bar_end = _STAGE_BAR_X + (self._bar_end() - _STAGE_BAR_X) * progress
+        path = str(canvas)
+        self.tk.eval("\n".join(
+            f"{path} coords {indicator['bar']} {_STAGE_BAR_X} {indicator['y'] - 5} {bar_end} {indicator['y'] + 5}"
+            for indicator in self.stage_indicators
+        ))
+        
+        # 마지막으로 그린 상태 갱신
+        for indicator in self.stage_indicators:
+            indicator["complete"] = complete
+            indicator["progress"] = progress
+            indicator["status_text"] = status_text
+        
     def update_stage(self, stage_index: int, progress: float = 0, 
                    message: str = "", is_complete: bool = False):
         """특정 단계의 진행 상태를 업데이트합니다."""
@@ -131,44 +253,26 @@ class ConversionProgressWidget(ttk.Frame):
             # 단계 인디케이터 업데이트
             indicator = self.stage_indicators[stage_index]
             
-            # 완료 여부
-            indicator["check_var"].set(is_complete)
-            
-            # 진행률
-            indicator["progress_var"].set(progress * 100)
-            
             # 상태 메시지
             if message:
-                indicator["status_var"].set(message)
+                status_text = message
             elif is_complete:
-                indicator["status_var"].set("완료")
+                status_text = "완료"
             else:
-                indicator["status_var"].set(f"{int(progress * 100)}%")
+                status_text = f"{int(progress * 100)}%"
                 
-            # 현재 단계 하이라이트
-            for i, ind in enumerate(self.stage_indicators):
-                if i == stage_index:
-                    ind["label"].configure(font=("", 10, "bold"))
-                else:
-                    ind["label"].configure(font=("", 10))
-                    
-            # 전체 진행률 업데이트 (각 단계의 가중치는 균등하게 설정)
-            total_progress = 0
-            for i, ind in enumerate(self.stage_indicators):
-                if i < stage_index:
-                    # 이전 단계는 100%
-                    stage_contribution = 1.0
-                elif i == stage_index:
-                    # 현재 단계는 현재 진행률
-                    stage_contribution = progress
-                else:
-                    # 다음 단계는 0%
-                    stage_contribution = 0.0
-                    
-                # 각 단계별 가중치 적용 (단순화를 위해 모든 단계의 가중치는 동일)
-                total_progress += stage_contribution / len(self.STAGES)
+            # 완료 여부, 진행률, 상태 메시지
+            self._set_stage(indicator, is_complete, max(0.0, min(progress, 1.0)), status_text)
                 
-            self.progress_var.set(total_progress * 100)
+            # 현재 단계 하이라이트 (단계가 바뀐 경우에만 이전/현재 레이블 두 개만 변경)
+            if stage_index != self.current_stage:
+                self.stages_canvas.itemconfigure(
+                    self.stage_indicators[self.current_stage]["label"], font=_STAGE_FONT)
+                self.stages_canvas.itemconfigure(indicator["label"], font=_STAGE_ACTIVE_FONT)
+                    
+            # 전체 진행률 업데이트 (모든 단계의 가중치는 동일: 이전 단계 100%, 현재 단계 진행률, 다음 단계 0%)
+            total_progress = (stage_index + progress) / len(self.STAGES)
+            self._set_if_changed(self.progress_var, total_progress * 100)
             
             # 현재 단계 업데이트
             self.current_stage = stage_index
@@ -176,40 +280,7 @@ class ConversionProgressWidget(ttk.Frame):
     def set_status(self, message: str):
         """전체 상태 메시지를 설정합니다."""
         self.status_message = message
-        
-        # 상태 메시지가 너무 긴 경우 축약
-        max_length = 50  # 최대 표시 길이
-        if len(message) > max_length:
-            # 파일 경로 형태인 경우 (파일명:파일명 패턴)
-            if " → " in message:
-                parts = message.split(" → ")
-                if len(parts) == 2:
-                    # 앞부분과 뒷부분 각각 처리
-                    prefix = parts[0]
-                    suffix = parts[1]
-                    
-                    # 앞부분이 너무 길면 축약
-                    if len(prefix) > max_length // 2:
-                        prefix_parts = prefix.split(": ", 1)
-                        if len(prefix_parts) > 1:
-                            # "변환 중..." 같은 접두사가 있으면 유지
-                            short_prefix = f"{prefix_parts[0]}: {os.path.basename(prefix_parts[1])}"
-                        else:
-                            # 파일명만 추출
-                            short_prefix = os.path.basename(prefix)
-                        prefix = short_prefix
-                    
-                    # 뒷부분이 너무 길면 축약
-                    if len(suffix) > max_length // 2:
-                        suffix = os.path.basename(suffix)
-                        
-                    # 축약된 메시지 조합
-                    message = f"{prefix} → {suffix}"
-            else:
-                # 일반 텍스트인 경우
-                message = message[:max_length-3] + "..."
-        
-        self.status_var.set(message)
+        self._set_if_changed(self.status_var, _truncate_status(message))
     
     def set_time(self, elapsed_seconds: float):
         """경과 시간을 설정합니다."""
@@ -220,19 +291,19 @@ class ConversionProgressWidget(ttk.Frame):
             seconds = int(elapsed_seconds % 60)
             time_str = f"{minutes}분 {seconds}초"
             
-        self.time_var.set(time_str)
+        self._set_if_changed(self.time_var, time_str)
     
     def set_error(self, error_message: str):
         """오류 메시지를 설정합니다."""
         if error_message:
             self.is_error = True
             self.error_message = error_message
-            self.error_var.set(f"오류: {error_message}")
+            self._set_if_changed(self.error_var, f"오류: {error_message}")
             self.error_frame.pack(fill="x")
         else:
             self.is_error = False
             self.error_message = ""
-            self.error_var.set("")
+            self._set_if_changed(self.error_var, "")
             self.error_frame.pack_forget()
     
     def complete(self):
@@ -240,13 +311,10 @@ class ConversionProgressWidget(ttk.Frame):
         self.is_complete = True
         
         # 모든 단계 완료로 표시
-        for indicator in self.stage_indicators:
-            indicator["check_var"].set(True)
-            indicator["progress_var"].set(100)
-            indicator["status_var"].set("완료")
+        self._set_all_stages(True, 1.0, "완료")
             
         # 전체 진행률 100%
-        self.progress_var.set(100)
+        self._set_if_changed(self.progress_var, 100)
         
         # 상태 메시지 업데이트
         self.set_status("변환 완료")
@@ -263,18 +331,15 @@ class ConversionProgressWidget(ttk.Frame):
         self.set_error("")
         
         # 전체 진행률 초기화
-        self.progress_var.set(0)
+        self._set_if_changed(self.progress_var, 0)
         
         # 모든 단계 초기화
-        for indicator in self.stage_indicators:
-            indicator["check_var"].set(False)
-            indicator["progress_var"].set(0)
-            indicator["status_var"].set("")
-            indicator["label"].configure(font=("", 10))  # 기본 폰트로 복원
+        self._set_all_stages(False, 0.0, "")
+        self.stages_canvas.itemconfigure("stage_label", font=_STAGE_FONT)  # 기본 폰트로 복원
             
         # 첫 번째 단계 하이라이트
         if self.stage_indicators:
-            self.stage_indicators[0]["label"].configure(font=("", 10, "bold"))
+            self.stages_canvas.itemconfigure(self.stage_indicators[0]["label"], font=_STAGE_ACTIVE_FONT)
     
     def start(self):
         """변환 시작 상태로 설정합니다."""
@@ -1,15 +1,61 @@
 import tkinter as tk
 from tkinter import ttk, filedialog
 import os
-import glob
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Callable, Optional
 from tkinterdnd2 import DND_FILES
+from src.utils.file_utils import format_file_size
+
+# 폴더 정보에 개수를 표시할 이미지 확장자 (소문자)
+_IMAGE_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".tif", ".tiff", ".exr", ".bmp", ".hdr", ".tga"})
+
+# 위젯이 사용하는 ttk 스타일 (스타일 이름 -> 옵션)
+_STYLE_OPTIONS = {
+    "DropFrame.TFrame": {"borderwidth": 1, "relief": "solid"},
+    "WarningFrame.TFrame": {"borderwidth": 2, "relief": "solid"},
+    "PathName.TLabel": {"font": ("", 10, "bold")},
+    "SmallPath.TLabel": {"font": ("", 7), "foreground": "gray"},
+    "Warning.TLabel": {"foreground": "#CC3300", "font": ("", 7, "bold")},
+}
+
+# 폴더/파일 정보 조회 결과 확인 간격 (ms)
+_SCAN_POLL_MS = 50
+
+def _count_image_files(path: str) -> int:
+    """폴더 바로 아래의 이미지 파일 수를 반환합니다. 폴더 수정 시각이 같으면 이전 결과를 재사용합니다."""
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+    return _count_image_files_cached(path, mtime_ns)
+
+@lru_cache(maxsize=64)
+def _count_image_files_cached(path: str, mtime_ns: int) -> int:
+    """폴더 바로 아래의 이미지 파일 수를 한 번의 디렉토리 순회로 계산합니다 (mtime_ns는 캐시 키로만 사용)."""
+    count = 0
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                # 확장자 비교(문자열 연산)를 먼저 하고, 이미지 확장자인 항목만 파일 여부 확인
+                # (DirEntry.is_file()은 디렉토리 순회 시 얻은 정보를 사용하므로 추가 stat 호출이 거의 없음)
+                name = entry.name
+                dot = name.rfind(".")
+                if dot > 0 and name[dot:].lower() in _IMAGE_EXTENSIONS and entry.is_file(follow_symlinks=False):
+                    count += 1
+    except OSError:
+        return 0
+    return count
 
 class FilePathEntry(ttk.Frame):
     """파일/폴더 경로 입력 위젯"""
     
+    # 폴더 순회/파일 크기 조회는 UI 스레드를 막지 않도록 모든 인스턴스가 공유하는 작업 스레드에서 실행
+    _scan_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="path_scan")
+    
     def __init__(self, parent, title="", browse_command=None, on_path_change=None,
-                 allow_directory=True, clear_command=None, show_full_path=False, on_drop=None):
+                 allow_directory=True, clear_command=None, show_full_path=False, on_drop=None,
+                 on_paths_dropped=None):
         """
         파일 경로 입력 위젯을 초기화합니다.
         
@@ -21,7 +67,8 @@ class FilePathEntry(ttk.Frame):
             allow_directory: 디렉토리 선택 허용 여부
             clear_command: 초기화 버튼 클릭 시 실행할 함수
             show_full_path: 전체 경로 표시 여부
-            on_drop: 파일/폴더 드롭 시 실행할 함수
+            on_drop: 파일/폴더 드롭 시 실행할 함수 (첫 번째 경로 전달)
+            on_paths_dropped: 파일/폴더 드롭 시 실행할 함수 (드롭된 전체 경로 튜플 전달, 지정 시 on_drop보다 우선)
         """
         super().__init__(parent)
         self.browse_command = browse_command
@@ -30,15 +77,19 @@ class FilePathEntry(ttk.Frame):
         self.clear_command = clear_command
         self.show_full_path = show_full_path
         self.on_drop = on_drop  # 드롭 이벤트 콜백
+        self.on_paths_dropped = on_paths_dropped  # 여러 경로 드롭 이벤트 콜백
+        self._dnd_registered = False  # 드롭 대상 등록 여부
         self.is_drag_over = False
         self.path = ""  # 실제 전체 경로
         self.is_directory = False  # 디렉토리 여부
         self.has_warning = False  # 경고 표시 여부
+        self._pending_future = None  # 진행 중인 폴더/파일 정보 조회 작업
+        self._placeholder_visible = True  # 안내 메시지 표시 여부 (처음에는 표시)
+        self._info_visible = False  # 경로 정보 영역 표시 여부
+        self._warning_visible = False  # 경고 레이블 표시 여부
         
         # 스타일 설정
-        style = ttk.Style()
-        style.configure("DropFrame.TFrame", borderwidth=1, relief="solid")
-        style.configure("WarningFrame.TFrame", borderwidth=2, relief="solid")
+        self._configure_styles()
         
         # 제목 표시
         if title:
@@ -61,52 +112,8 @@ class FilePathEntry(ttk.Frame):
         )
         self.placeholder_label.pack(pady=10)
         
-        # 경로 정보 표시 영역 - 처음에는 숨김
-        self.info_frame = ttk.Frame(self.drop_frame)
-        
-        # 파일/폴더 이름 레이블
-        self.name_var = tk.StringVar()
-        name_style = ttk.Style()
-        name_style.configure("PathName.TLabel", font=("", 10, "bold"))
-        self.name_label = ttk.Label(
-            self.info_frame, 
-            textvariable=self.name_var,
-            style="PathName.TLabel"
-        )
-        self.name_label.pack(pady=(5, 2))
-        
-        # 경로 또는 추가 정보 레이블
-        self.info_var = tk.StringVar()
-        self.info_label = ttk.Label(
-            self.info_frame, 
-            textvariable=self.info_var,
-            foreground="gray"
-        )
-        self.info_label.pack(pady=(0, 2))
-        
-        # 경로 표시 레이블 (작은 글씨로 항상 표시)
-        self.path_var = tk.StringVar()
-        path_style = ttk.Style()
-        path_style.configure("SmallPath.TLabel", font=("", 7), foreground="gray")
-        self.path_label = ttk.Label(
-            self.info_frame, 
-            textvariable=self.path_var,
-            style="SmallPath.TLabel",
-            wraplength=350  # 긴 경로를 여러 줄로 표시
-        )
-        self.path_label.pack(pady=(0, 5))
-        
-        # 경고 레이블 (파일이 이미 존재할 때 표시)
-        warning_style = ttk.Style()
-        warning_style.configure("Warning.TLabel", foreground="#CC3300", font=("", 7, "bold"))
-        self.warning_var = tk.StringVar()
-        self.warning_label = ttk.Label(
-            self.info_frame,
-            textvariable=self.warning_var,
-            style="Warning.TLabel"
-        )
-        self.warning_label.pack(pady=(0, 5))
-        self.warning_label.pack_forget()  # 초기에는 숨김
+        # 경로 정보 표시 영역 - 처음 경로가 설정될 때 생성
+        self._info_built = False
         
         # 버튼 프레임
         button_frame = ttk.Frame(self)
@@ -132,11 +139,27 @@ class FilePathEntry(ttk.Frame):
         self._setup_drag_drop()
         
         # 최소 높이 설정 (폴더 정보를 표시할 영역 확보)
-        self.drop_frame.update_idletasks()  # 실제 크기 업데이트
+        # 드롭 영역의 내용은 place로 배치되어 크기를 전파하지 않으므로 유휴 작업을 미리 처리할 필요 없음
         self.drop_frame.configure(height=80 if not show_full_path else 100)
         
+    def _configure_styles(self):
+        """위젯 스타일을 설정합니다. 스타일은 루트 윈도우 단위로 유지되므로 인스턴스가 여럿이어도 한 번만 설정합니다."""
+        root = self._root()
+        if getattr(root, "_file_path_entry_styles_done", False):
+            return
+            
+        style = ttk.Style(root)
+        for style_name, options in _STYLE_OPTIONS.items():
+            style.configure(style_name, **options)
+            
+        root._file_path_entry_styles_done = True
+        
     def _setup_drag_drop(self):
-        """드래그 앤 드롭 기능을 설정합니다."""
+        """드래그 앤 드롭 기능을 설정합니다. 이미 등록된 경우 다시 등록하지 않습니다."""
+        if self._dnd_registered:
+            return
+        self._dnd_registered = True
+        
         # 드롭 대상으로 설정
         self.drop_frame.drop_target_register(DND_FILES)
         
@@ -160,12 +183,18 @@ class FilePathEntry(ttk.Frame):
         self.is_drag_over = False
         self.drop_frame.configure(borderwidth=1)
         
-        # 드롭된 파일 경로 처리
-        file_path = event.data
-        
-        # Windows에서는 중괄호로 묶인 경로가 올 수 있음
-        if file_path.startswith("{") and file_path.endswith("}"):
-            file_path = file_path[1:-1]
+        # 드롭된 파일 경로 처리 (공백이 있는 경로는 중괄호로 묶여 오므로 Tcl 목록으로 해석)
+        paths = self.tk.splitlist(event.data)
+        if not paths:
+            return
+            
+        # 전체 경로를 받는 콜백이 있으면 그대로 전달
+        if self.on_paths_dropped:
+            self.on_paths_dropped(paths)
+            return
+            
+        # 여러 항목이 드롭된 경우 첫 번째 항목만 사용
+        file_path = paths[0]
             
         # 드롭 콜백이 있으면 콜백 함수 호출
         if self.on_drop:
@@ -191,11 +220,16 @@ class FilePathEntry(ttk.Frame):
             self.clear_path()
             return
             
-        self.path = path
-        self.is_directory = os.path.isdir(path)
+        is_directory = os.path.isdir(path)
         
-        # UI 업데이트
-        self._update_display()
+        # 같은 경로가 다시 설정된 경우 표시는 그대로 두고 콜백만 전달
+        # (파일 내용 변경 여부는 콜백 쪽에서 stat 정보로 판단)
+        if path != self.path or is_directory != self.is_directory:
+            self.path = path
+            self.is_directory = is_directory
+            
+            # UI 업데이트
+            self._update_display()
         
         # 콜백 호출
         if self.on_path_change:
@@ -205,13 +239,14 @@ class FilePathEntry(ttk.Frame):
         """경로 정보 표시를 업데이트합니다."""
         if not self.path:
             # 경로가 없는 경우 초기 상태로
-            self.info_frame.place_forget()
-            self.placeholder_label.pack(pady=10)
+            self._set_info_visible(False)
+            self._set_placeholder_visible(True)
             self.has_warning = False
-            self.warning_label.pack_forget()
-            self.drop_frame.configure(style="DropFrame.TFrame")
+            self._set_warning_visible(False)
             return
             
+        self._ensure_info_built()
+        
         # 항상 전체 경로 표시 (작은 글씨로)
         self.path_var.set(self.path)
             
@@ -221,63 +256,151 @@ class FilePathEntry(ttk.Frame):
             folder_name = os.path.basename(self.path)
             self.name_var.set(folder_name)
             
-            # 폴더 내 이미지 파일 수 계산
-            image_extensions = (".png", ".jpg", ".jpeg", ".tif", ".tiff", ".exr", ".bmp", ".hdr", ".tga")
-            image_files = []
-            for ext in image_extensions:
-                # 대소문자 구분 없이 검색 (각 확장자의 대소문자 버전을 모두 추가하되, 중복 제거)
-                lower_pattern = os.path.join(self.path, f"*{ext}")
-                upper_pattern = os.path.join(self.path, f"*{ext.upper()}")
-                
-                # 중복을 방지하기 위해 set 사용
-                files = set(glob.glob(lower_pattern)).union(set(glob.glob(upper_pattern)))
-                image_files.extend(files)
-            
-            num_images = len(image_files)
-            
-            # 폴더 정보 표시
-            self.info_var.set(f"이미지 파일 {num_images}개")
+            # 폴더 내 이미지 파일 수는 작업 스레드에서 계산 (대소문자 구분 없음)
+            self.info_var.set("계산 중…")
+            self._start_scan(_count_image_files)
             
             # 폴더는 경고 표시 안함
             self.has_warning = False
-            self.warning_label.pack_forget()
-            self.drop_frame.configure(style="DropFrame.TFrame")
+            self._set_warning_visible(False)
         else:
             # 파일인 경우
             file_name = os.path.basename(self.path)
             self.name_var.set(file_name)
             
-            # 파일 크기 계산
-            try:
-                file_size = os.path.getsize(self.path)
-                size_str = self._format_file_size(file_size)
-                
-                # 파일 정보 표시
-                self.info_var.set(size_str)
-            except Exception:
-                self.info_var.set("파일 정보를 읽을 수 없습니다")
+            # 파일 크기는 작업 스레드에서 조회
+            self.info_var.set("계산 중…")
+            self._start_scan(os.path.getsize)
                 
         # 플레이스홀더 숨기고 정보 표시
-        self.placeholder_label.pack_forget()
-        self.info_frame.place(relx=0.5, rely=0.5, anchor="center")
-        
-    def _format_file_size(self, size_bytes):
-        """파일 크기를 읽기 쉬운 형식으로 변환합니다."""
-        if size_bytes < 1024:
-            return f"{size_bytes} B"
-        elif size_bytes < 1024 * 1024:
-            return f"{size_bytes / 1024:.1f} KB"
-        elif size_bytes < 1024 * 1024 * 1024:
-            return f"{size_bytes / (1024 * 1024):.1f} MB"
+        self._set_placeholder_visible(False)
+        self._set_info_visible(True)
+        
+    def _ensure_info_built(self):
+        """경로 정보 표시 위젯을 처음 필요할 때 생성합니다."""
+        if self._info_built:
+            return
+        self._info_built = True
+        
+        # 경로 정보 표시 영역 (표시 전까지 숨김)
+        self.info_frame = ttk.Frame(self.drop_frame)
+        
+        # 파일/폴더 이름 레이블
+        self.name_var = tk.StringVar()
+        self.name_label = ttk.Label(
+            self.info_frame, 
+            textvariable=self.name_var,
+            style="PathName.TLabel"
+        )
+        self.name_label.pack(pady=(5, 2))
+        
+        # 경로 또는 추가 정보 레이블
+        self.info_var = tk.StringVar()
+        self.info_label = ttk.Label(
+            self.info_frame, 
+            textvariable=self.info_var,
+            foreground="gray"
+        )
+        self.info_label.pack(pady=(0, 2))
+        
+        # 경로 표시 레이블 (작은 글씨로 항상 표시)
+        self.path_var = tk.StringVar()
+        self.path_label = ttk.Label(
+            self.info_frame, 
+            textvariable=self.path_var,
+            style="SmallPath.TLabel",
+            wraplength=350  # 긴 경로를 여러 줄로 표시
+        )
+        self.path_label.pack(pady=(0, 5))
+        
+        # 경고 레이블 (파일이 이미 존재할 때 표시, 초기에는 숨김)
+        self.warning_var = tk.StringVar(value="⚠️ 이 파일은 이미 존재합니다. 변환 시 덮어쓰기됩니다.")
+        self.warning_label = ttk.Label(
+            self.info_frame,
+            textvariable=self.warning_var,
+            style="Warning.TLabel"
+        )
+        
+    def _set_placeholder_visible(self, visible: bool):
+        """안내 메시지 표시 상태를 바꿉니다 (상태가 바뀔 때만 배치 관리자 호출)."""
+        if visible == self._placeholder_visible:
+            return
+        if visible:
+            self.placeholder_label.pack(pady=10)
         else:
-            return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
+            self.placeholder_label.pack_forget()
+        self._placeholder_visible = visible
+        
+    def _set_info_visible(self, visible: bool):
+        """경로 정보 영역 표시 상태를 바꿉니다 (상태가 바뀔 때만 배치 관리자 호출)."""
+        if visible == self._info_visible:
+            return
+        if visible:
+            self.info_frame.place(relx=0.5, rely=0.5, anchor="center")
+        else:
+            self.info_frame.place_forget()
+        self._info_visible = visible
         
+    def _set_warning_visible(self, visible: bool):
+        """경고 레이블과 경고 테두리 스타일 표시 상태를 바꿉니다 (상태가 바뀔 때만 호출)."""
+        if visible == self._warning_visible:
+            return
+        if visible:
+            self._ensure_info_built()
+            self.warning_label.pack(pady=(0, 5))
+            # 경고 스타일 적용 (빨간색 테두리)
+            self.drop_frame.configure(style="WarningFrame.TFrame")
+        else:
+            self.warning_label.pack_forget()
+            # 기본 스타일로 복원
+            self.drop_frame.configure(style="DropFrame.TFrame")
+        self._warning_visible = visible
+        
+    def _start_scan(self, scan_func: Callable[[str], int]):
+        """현재 경로에 대한 정보 조회를 작업 스레드에 맡기고 결과를 주기적으로 확인합니다."""
+        self._cancel_scan()
+        future = self._scan_executor.submit(scan_func, self.path)
+        self._pending_future = future
+        self.after(_SCAN_POLL_MS, self._poll_scan, future)
+        
+    def _cancel_scan(self):
+        """진행 중인 정보 조회를 취소합니다 (이미 실행 중이면 결과만 무시)."""
+        if self._pending_future is not None:
+            self._pending_future.cancel()
+            self._pending_future = None
+            
+    def _poll_scan(self, future):
+        """정보 조회 완료 여부를 확인합니다."""
+        # 이후 경로가 바뀌어 다른 조회가 시작되었거나 취소된 경우 무시
+        if future is not self._pending_future:
+            return
+        if not future.done():
+            self.after(_SCAN_POLL_MS, self._poll_scan, future)
+            return
+            
+        self._pending_future = None
+        self._apply_scan_result(future)
+        
+    def _apply_scan_result(self, future):
+        """정보 조회 결과를 표시합니다."""
+        try:
+            result = future.result()
+        except Exception:
+            self.info_var.set("파일 정보를 읽을 수 없습니다")
+            return
+            
+        if self.is_directory:
+            self.info_var.set(f"이미지 파일 {result}개")
+        else:
+            self.info_var.set(format_file_size(result))
+            
     def get_path(self) -> str:
         """현재 설정된 경로를 반환합니다."""
         return self.path
         
     def clear_path(self):
         """경로를 초기화합니다."""
+        self._cancel_scan()
         self.path = ""
         self.is_directory = False
         self._update_display()
@@ -294,13 +417,4 @@ class FilePathEntry(ttk.Frame):
             show: 경고 표시 여부
         """
         self.has_warning = show
-        
-        if show:
-            self.warning_var.set("⚠️ 이 파일은 이미 존재합니다. 변환 시 덮어쓰기됩니다.")
-            self.warning_label.pack(pady=(0, 5))
-            # 경고 스타일 적용 (빨간색 테두리)
-            self.drop_frame.configure(style="WarningFrame.TFrame")
-        else:
-            self.warning_label.pack_forget()
-            # 기본 스타일로 복원
-            self.drop_frame.configure(style="DropFrame.TFrame") 
\ No newline at end of file
+        self._set_warning_visible(show) 
\ No newline at end of file
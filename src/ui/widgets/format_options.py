@@ -4,6 +4,17 @@ from typing import Dict, List, Tuple, Optional, Union, Any, Callable
 from src.utils.image_utils import ImageFormatUtils
 from src.color_management import ColorManager
 
+# Tk 변수 타입별 값 변환 함수
+_VAR_CONVERTERS = {
+    tk.BooleanVar: bool,
+    tk.DoubleVar: float,
+    tk.IntVar: int,
+    tk.StringVar: str,
+}
+
+# 슬라이더 드래그 중 옵션 변경 콜백을 모아서 호출하는 간격 (ms)
+_SLIDER_NOTIFY_DELAY_MS = 50
+
 class FormatOptionsWidget(ttk.LabelFrame):
     """포맷 변환 관련 옵션을 설정하는 위젯"""
     
@@ -14,11 +25,16 @@ class FormatOptionsWidget(ttk.LabelFrame):
         self.on_option_change = on_option_change
         self.options = {}  # 현재 설정된 옵션 값
         self.option_widgets = {}  # 옵션 위젯 레퍼런스
+        self._option_index = {}  # 옵션 이름 -> 옵션 위젯 정보 (섹션을 거치지 않고 바로 조회)
+        self._pending_notify = {}  # 옵션 이름 -> 예약된 변경 콜백 ID
+        self._visible_sections = set()  # 현재 표시 중인 섹션 이름
         
         # 색 관리 모듈 초기화
         self.color_manager = ColorManager()
         self.input_format = None
         self.output_format = None
+        self._hdr_to_ldr = False  # HDR → LDR 변환 여부 (포맷 변경 시 한 번 계산)
+        self._drops_alpha = False  # 알파 채널 제거 필요 여부 (포맷 변경 시 한 번 계산)
         
         self._setup_ui()
         
@@ -189,6 +205,7 @@ class FormatOptionsWidget(ttk.LabelFrame):
             "frame": section_frame,
             "options": {}
         }
+        self._visible_sections.add(section_name)
         
     def _add_slider_option(self, section: str, name: str, label: str, 
                           min_val: float, max_val: float, default: float,
@@ -237,28 +254,28 @@ class FormatOptionsWidget(ttk.LabelFrame):
         def _validate_and_update(*args):
             try:
                 # 현재 값을 가져옴
-                value = value_var.get()
+                raw_value = value_var.get()
                 
                 # 범위 검사 및 보정
-                if value < min_val:
-                    value = min_val
-                    value_var.set(min_val)
-                elif value > max_val:
-                    value = max_val
-                    value_var.set(max_val)
+                value = min(max(raw_value, min_val), max_val)
                 
                 # 설정된 해상도에 맞게 반올림
                 if resolution > 0:
                     value = round(value / resolution) * resolution
+                    
+                # 보정된 경우에만 다시 씀
+                if value != raw_value:
                     value_var.set(value)
-                
-                # 옵션 갱신 및 콜백 호출
-                self._notify_option_change(name, value)
-                
+                    
             except (ValueError, tk.TclError):
                 # 입력 값이 유효하지 않을 경우 기본값으로 재설정
+                value = default
                 value_var.set(default)
                 
+            # 옵션 갱신 및 콜백 호출 (반올림 결과가 현재 옵션 값과 같으면 생략)
+            if name not in self.options or value != self.options[name]:
+                self._notify_option_change(name, value, deferred=True)
+                
         # 입력 필드에서 Enter 키 누를 때 검증
         def _on_enter(event):
             _validate_and_update()
@@ -267,12 +284,13 @@ class FormatOptionsWidget(ttk.LabelFrame):
         def _on_focus_out(event):
             _validate_and_update()
         
-        # 슬라이더 변경 시 값 업데이트
-        def _on_scale_change(*args):
+        # 슬라이더 변경 시 값 업데이트 (변수 쓰기 trace 대신 슬라이더 명령으로 직접 호출하여
+        # 검증 중 보정 값을 쓰거나 저장된 값을 불러올 때는 호출되지 않음)
+        def _on_scale_change(value):
             _validate_and_update()
         
         # 이벤트 바인딩
-        value_var.trace_add("write", _on_scale_change)
+        slider.configure(command=_on_scale_change)
         entry.bind("<Return>", _on_enter)
         entry.bind("<FocusOut>", _on_focus_out)
         
@@ -283,9 +301,11 @@ class FormatOptionsWidget(ttk.LabelFrame):
         section_data["options"][name] = {
             "frame": option_frame,
             "var": value_var,
+            "var_type": type(value_var),
             "widget": slider,
             "entry": entry
         }
+        self._option_index[name] = section_data["options"][name]
         
         # 기본값 저장
         self.options[name] = default
@@ -332,7 +352,8 @@ class FormatOptionsWidget(ttk.LabelFrame):
         # 값 변경 시 처리
         def _on_select(event):
             idx = combo.current()
-            if 0 <= idx < len(actual_values):
+            # 같은 항목을 다시 선택한 경우 알리지 않음
+            if 0 <= idx < len(actual_values) and self.options.get(name) != actual_values[idx]:
                 self.options[name] = actual_values[idx]
                 self._notify_option_change(name, actual_values[idx])
         
@@ -342,38 +363,79 @@ class FormatOptionsWidget(ttk.LabelFrame):
         section_data["options"][name] = {
             "frame": option_frame,
             "var": value_var,
+            "var_type": type(value_var),
             "widget": combo,
             "values": actual_values
         }
+        self._option_index[name] = section_data["options"][name]
     
     def _create_tooltip(self, widget, text):
-        """위젯에 툴팁을 추가합니다."""
-        def _show_tooltip(event):
-            x, y, _, _ = widget.bbox("insert")
-            x += widget.winfo_rootx() + 25
-            y += widget.winfo_rooty() + 25
+        """위젯에 툴팁을 추가합니다. 툴팁 문자열은 위젯에 보관하고 이벤트 처리기는 모든 위젯이 공유합니다."""
+        widget._tooltip_text = text
+        widget._tooltip_win = None
+        widget.bind("<Enter>", self._show_tooltip)
+        widget.bind("<Leave>", self._hide_tooltip)
+        
+    @staticmethod
+    def _show_tooltip(event):
+        """마우스가 위젯에 들어오면 툴팁을 표시합니다."""
+        widget = event.widget
+        text = getattr(widget, "_tooltip_text", None)
+        if not text or getattr(widget, "_tooltip_win", None) is not None:
+            return
             
-            # 툴팁 생성
-            tooltip = tk.Toplevel(widget)
-            tooltip.wm_overrideredirect(True)
-            tooltip.wm_geometry(f"+{x}+{y}")
+        # 레이블 아래쪽에 표시 (레이블에는 입력 커서가 없으므로 위젯 화면 좌표만 사용)
+        x = widget.winfo_rootx() + 25
+        y = widget.winfo_rooty() + widget.winfo_height() + 5
+        
+        # 툴팁 생성
+        tooltip = tk.Toplevel(widget)
+        tooltip.wm_overrideredirect(True)
+        tooltip.wm_geometry(f"+{x}+{y}")
+        
+        label = ttk.Label(tooltip, text=text, background="#ffffe0", relief="solid", borderwidth=1, padding=3)
+        label.pack()
+        
+        widget._tooltip_win = tooltip
+        
+    @staticmethod
+    def _hide_tooltip(event):
+        """마우스가 위젯을 벗어나면 툴팁을 닫습니다."""
+        widget = event.widget
+        tooltip = getattr(widget, "_tooltip_win", None)
+        if tooltip is not None:
+            tooltip.destroy()
+            widget._tooltip_win = None
+    
+    def _notify_option_change(self, name, value, deferred: bool = False):
+        """
+        옵션 변경을 알립니다.
+        
+        Args:
+            name: 옵션 이름
+            value: 변경된 값
+            deferred: True이면 콜백을 잠시 미뤄 연속 변경(슬라이더 드래그)을 마지막 값 한 번으로 합침
+        """
+        self.options[name] = value
+        
+        # 이전에 예약된 같은 옵션의 콜백은 취소 (값은 이미 self.options에 반영됨)
+        pending_id = self._pending_notify.pop(name, None)
+        if pending_id is not None:
+            self.after_cancel(pending_id)
             
-            label = ttk.Label(tooltip, text=text, background="#ffffe0", relief="solid", borderwidth=1, padding=3)
-            label.pack()
+        if not self.on_option_change:
+            return
             
-            self._tooltip = tooltip
+        if deferred:
+            self._pending_notify[name] = self.after(
+                _SLIDER_NOTIFY_DELAY_MS, self._flush_option_change, name, value
+            )
+        else:
+            self.on_option_change(name, value, self.options)
             
-        def _hide_tooltip(event):
-            if hasattr(self, '_tooltip'):
-                self._tooltip.destroy()
-                del self._tooltip
-                
-        widget.bind("<Enter>", _show_tooltip)
-        widget.bind("<Leave>", _hide_tooltip)
-    
-    def _notify_option_change(self, name, value):
-        """옵션 변경을 알립니다."""
-        self.options[name] = value
+    def _flush_option_change(self, name, value):
+        """미뤄 둔 옵션 변경 콜백을 호출합니다."""
+        self._pending_notify.pop(name, None)
         if self.on_option_change:
             self.on_option_change(name, value, self.options)
             
@@ -382,6 +444,10 @@ class FormatOptionsWidget(ttk.LabelFrame):
         self.input_format = input_format
         self.output_format = output_format
         
+        # 포맷 조합 특성은 옵션 추가와 UI 갱신에서 함께 사용하므로 한 번만 계산
+        self._hdr_to_ldr = ImageFormatUtils.is_hdr_format(input_format) and not ImageFormatUtils.is_hdr_format(output_format)
+        self._drops_alpha = ImageFormatUtils.has_alpha_support(input_format) and not ImageFormatUtils.has_alpha_support(output_format)
+        
         # 옵션 초기화
         self.options = {}
         
@@ -408,19 +474,12 @@ class FormatOptionsWidget(ttk.LabelFrame):
                 else:
                     self.options[key] = value
                     
-                # 위젯에도 값 설정
-                for section_name, section_data in self.option_widgets.items():
-                    if key in section_data["options"]:
-                        option_data = section_data["options"][key]
-                        if "var" in option_data:
-                            if isinstance(option_data["var"], tk.BooleanVar):
-                                option_data["var"].set(bool(value))
-                            elif isinstance(option_data["var"], tk.DoubleVar):
-                                option_data["var"].set(float(value))
-                            elif isinstance(option_data["var"], tk.IntVar):
-                                option_data["var"].set(int(value))
-                            elif isinstance(option_data["var"], tk.StringVar):
-                                option_data["var"].set(str(value))
+                # 위젯에도 값 설정 (변수 타입은 옵션 등록 시 기록해 둠)
+                option_data = self._option_index.get(key)
+                if option_data is not None:
+                    convert = _VAR_CONVERTERS.get(option_data["var_type"])
+                    if convert is not None:
+                        option_data["var"].set(convert(value))
                         
     def _add_options_for_formats(self, input_format: str, output_format: str):
         """입력 및 출력 포맷 조합에 따라 필요한 옵션을 추가합니다."""
@@ -428,11 +487,11 @@ class FormatOptionsWidget(ttk.LabelFrame):
         self._add_color_management_options()
         
         # HDR → LDR 변환 시 HDR 옵션 추가
-        if ImageFormatUtils.is_hdr_format(input_format) and not ImageFormatUtils.is_hdr_format(output_format):
+        if self._hdr_to_ldr:
             self._add_hdr_options()
         
         # 알파 채널 처리 필요 시 관련 옵션 추가
-        if ImageFormatUtils.has_alpha_support(input_format) and not ImageFormatUtils.has_alpha_support(output_format):
+        if self._drops_alpha:
             self._add_alpha_options()
             
         # JPEG 출력 시 품질 설정 추가
@@ -520,31 +579,56 @@ class FormatOptionsWidget(ttk.LabelFrame):
             
     def _update_ui(self):
         """옵션에 따라 UI를 업데이트합니다."""
-        # 모든 섹션 숨김
-        self._hide_all_option_sections()
-        
-        # 색 관리 옵션 (항상 표시)
-        self._show_option_section("color_management")
-        
-        # 색상 조정 옵션
-        self._show_option_section("color_adjustments")
+        # 색 관리 옵션 (항상 표시), 색상 조정 옵션
+        sections = ["color_management", "color_adjustments"]
         
         # HDR → LDR 변환 시 HDR 옵션 표시
-        if ImageFormatUtils.is_hdr_format(self.input_format) and not ImageFormatUtils.is_hdr_format(self.output_format):
-            self._show_option_section("hdr_options")
+        if self._hdr_to_ldr:
+            sections.append("hdr_options")
         
         # 알파 채널 처리 필요 시 관련 옵션 표시
-        if ImageFormatUtils.has_alpha_support(self.input_format) and not ImageFormatUtils.has_alpha_support(self.output_format):
-            self._show_option_section("alpha_options")
+        if self._drops_alpha:
+            sections.append("alpha_options")
             
         # JPEG 출력 시 품질 설정 표시
         if self.output_format == "JPEG":
-            self._show_option_section("jpeg_options")
+            sections.append("jpeg_options")
+            
+        self._set_visible_sections(sections)
+        
+    def _set_visible_sections(self, sections: List[str]):
+        """지정한 섹션만 표시합니다. 표시 상태가 바뀌는 섹션만 배치 관리자를 호출합니다."""
+        target = [name for name in sections if name in self.option_widgets]
+        target_set = set(target)
+        if target_set == self._visible_sections:
+            return
+            
+        # 숨길 섹션만 제거
+        self._forget_sections(self._visible_sections - target_set)
+            
+        # 새로 표시할 섹션만 다음 섹션 앞에 끼워 넣어 순서 유지 (sections는 표시 순서)
+        next_frame = None
+        for name in reversed(target):
+            frame = self.option_widgets[name]["frame"]
+            if name not in self._visible_sections:
+                if next_frame is not None:
+                    frame.pack(fill="x", pady=5, before=next_frame)
+                else:
+                    frame.pack(fill="x", pady=5)
+            next_frame = frame
+            
+        self._visible_sections = target_set
     
     def _hide_all_option_sections(self):
         """모든 옵션 섹션을 숨깁니다."""
-        for section_name, section_data in self.option_widgets.items():
-            section_data["frame"].pack_forget()
+        self._forget_sections(self._visible_sections)
+        self._visible_sections = set()
+        
+    def _forget_sections(self, section_names):
+        """여러 섹션 프레임을 한 번의 pack forget 명령으로 숨깁니다."""
+        frames = [str(self.option_widgets[name]["frame"]) for name in section_names]
+        if frames:
+            self.tk.call("pack", "forget", *frames)
             
     def _show_option_section(self, section_name: str):
         """지정한 옵션 섹션을 표시합니다."""
@@ -16,6 +16,12 @@ class FormatOptionsWidget(ttk.Frame):
         # 옵션 위젯 참조 저장
         self.option_widgets = {}
         
+        # 활성화 상태를 바꿀 위젯 목록 (위젯, 활성화 시 상태) - 생성 시 등록하여 set_enabled에서 트리 순회 없이 사용
+        self._stateful_widgets = []
+        self._enabled = None  # 마지막으로 적용한 활성화 상태
+        self._profile_visible = True  # 프로파일 선택 프레임 표시 여부 (처음에는 표시)
+        self._hdr_visible = False  # HDR 옵션 프레임 표시 여부 (처음에는 숨김)
+        
         # 색 관리 옵션 프레임
         self.color_frame = ttk.LabelFrame(self, text="색 관리")
         self.color_frame.pack(fill="x", pady=(0, 5))
@@ -26,6 +32,7 @@ class FormatOptionsWidget(ttk.Frame):
                                   variable=self.use_color_management,
                                   command=self._update_color_options)
         cm_check.pack(anchor="w")
+        self._register_stateful(cm_check)
         
         # 색 프로파일 선택 프레임
         self.profile_frame = ttk.Frame(self.color_frame)
@@ -34,76 +41,35 @@ class FormatOptionsWidget(ttk.Frame):
         # 입력 프로파일
         in_profile_label = ttk.Label(self.profile_frame, text="입력 프로파일:")
         in_profile_label.grid(row=0, column=0, sticky="w", padx=(0, 5))
+        self._register_stateful(in_profile_label)
         
         self.input_profile_var = tk.StringVar(value="자동 감지")
         self.input_profile_combo = ttk.Combobox(self.profile_frame, 
                                               textvariable=self.input_profile_var,
                                               state="readonly", width=15)
         self.input_profile_combo.grid(row=0, column=1, sticky="ew")
+        self._register_stateful(self.input_profile_combo, enabled_state="readonly")
         
         # 출력 프로파일
         out_profile_label = ttk.Label(self.profile_frame, text="출력 프로파일:")
         out_profile_label.grid(row=1, column=0, sticky="w", padx=(0, 5), pady=(5, 0))
+        self._register_stateful(out_profile_label)
         
         self.output_profile_var = tk.StringVar(value="sRGB")
         self.output_profile_combo = ttk.Combobox(self.profile_frame, 
                                                textvariable=self.output_profile_var,
                                                state="readonly", width=15)
         self.output_profile_combo.grid(row=1, column=1, sticky="ew", pady=(5, 0))
+        self._register_stateful(self.output_profile_combo, enabled_state="readonly")
         
         # 프로파일 콤보박스 가중치 설정
         self.profile_frame.columnconfigure(1, weight=1)
         
-        # HDR 변환 옵션 프레임
-        self.hdr_frame = ttk.LabelFrame(self, text="HDR 옵션")
-        
-        # 노출 설정
-        exposure_frame = ttk.Frame(self.hdr_frame)
-        exposure_frame.pack(fill="x", pady=(0, 5))
-        
-        exposure_label = ttk.Label(exposure_frame, text="노출:")
-        exposure_label.pack(side="left", padx=(0, 5))
-        
+        # HDR 변환 옵션 (값 변수만 미리 만들고, 프레임은 HDR → LDR 변환이 처음 선택될 때 생성)
+        self.hdr_frame = None
         self.exposure_var = tk.DoubleVar(value=1.0)
-        exposure_scale = ttk.Scale(exposure_frame, from_=0.1, to=5.0,
-                                  variable=self.exposure_var, 
-                                  orient="horizontal")
-        exposure_scale.pack(side="left", fill="x", expand=True)
-        
-        exposure_value = ttk.Label(exposure_frame, textvariable=self.exposure_var, width=5)
-        exposure_value.pack(side="left", padx=(5, 0))
-        
-        # 감마 설정
-        gamma_frame = ttk.Frame(self.hdr_frame)
-        gamma_frame.pack(fill="x", pady=(0, 5))
-        
-        gamma_label = ttk.Label(gamma_frame, text="감마:")
-        gamma_label.pack(side="left", padx=(0, 5))
-        
         self.gamma_var = tk.DoubleVar(value=2.2)
-        gamma_scale = ttk.Scale(gamma_frame, from_=1.0, to=4.0,
-                               variable=self.gamma_var, 
-                               orient="horizontal")
-        gamma_scale.pack(side="left", fill="x", expand=True)
-        
-        gamma_value = ttk.Label(gamma_frame, textvariable=self.gamma_var, width=5)
-        gamma_value.pack(side="left", padx=(5, 0))
-        
-        # 톤 매핑 방식
-        tone_map_frame = ttk.Frame(self.hdr_frame)
-        tone_map_frame.pack(fill="x")
-        
-        tone_map_label = ttk.Label(tone_map_frame, text="톤 매핑 방식:")
-        tone_map_label.pack(side="left", padx=(0, 5))
-        
         self.tone_map_var = tk.StringVar(value="Reinhard")
-        tone_map_combo = ttk.Combobox(tone_map_frame, 
-                                     textvariable=self.tone_map_var,
-                                     state="readonly")
-        tone_map_combo.pack(side="left", fill="x", expand=True)
-        
-        # 기본 톤 매핑 방식 설정
-        tone_map_combo["values"] = ["Reinhard", "Filmic", "ACES"]
         
         # 기타 옵션 프레임
         self.other_frame = ttk.LabelFrame(self, text="기타 옵션")
@@ -124,6 +90,7 @@ class FormatOptionsWidget(ttk.Frame):
         
         brightness_value = ttk.Label(brightness_frame, textvariable=self.brightness_var, width=5)
         brightness_value.pack(side="left", padx=(5, 0))
+        self._register_stateful(brightness_label, brightness_scale, brightness_value)
         
         # 대비 조정
         contrast_frame = ttk.Frame(self.other_frame)
@@ -140,6 +107,7 @@ class FormatOptionsWidget(ttk.Frame):
         
         contrast_value = ttk.Label(contrast_frame, textvariable=self.contrast_var, width=5)
         contrast_value.pack(side="left", padx=(5, 0))
+        self._register_stateful(contrast_label, contrast_scale, contrast_value)
         
         # 채도 조정
         saturation_frame = ttk.Frame(self.other_frame)
@@ -156,6 +124,7 @@ class FormatOptionsWidget(ttk.Frame):
         
         saturation_value = ttk.Label(saturation_frame, textvariable=self.saturation_var, width=5)
         saturation_value.pack(side="left", padx=(5, 0))
+        self._register_stateful(saturation_label, saturation_scale, saturation_value)
         
         # 옵션 위젯 참조 저장
         self.option_widgets = {
@@ -170,8 +139,7 @@ class FormatOptionsWidget(ttk.Frame):
             "saturation": self.saturation_var,
         }
         
-        # 기본적으로 HDR 옵션은 표시하지 않음
-        self.hdr_frame.pack_forget()
+        # 기본적으로 HDR 옵션은 표시하지 않음 (아직 배치하지 않은 상태)
         
         # 기타 옵션은 항상 표시
         self.other_frame.pack(fill="x", pady=(5, 0))
@@ -179,9 +147,78 @@ class FormatOptionsWidget(ttk.Frame):
         # 초기 색 관리 옵션 상태 업데이트
         self._update_color_options()
             
+    def _build_hdr_frame(self):
+        """HDR 옵션 프레임을 처음 필요할 때 생성합니다."""
+        if self.hdr_frame is not None:
+            return
+        first_widget = len(self._stateful_widgets)
+            
+        # HDR 변환 옵션 프레임
+        self.hdr_frame = ttk.LabelFrame(self, text="HDR 옵션")
+        
+        # 노출 설정
+        exposure_frame = ttk.Frame(self.hdr_frame)
+        exposure_frame.pack(fill="x", pady=(0, 5))
+        
+        exposure_label = ttk.Label(exposure_frame, text="노출:")
+        exposure_label.pack(side="left", padx=(0, 5))
+        
+        exposure_scale = ttk.Scale(exposure_frame, from_=0.1, to=5.0,
+                                  variable=self.exposure_var, 
+                                  orient="horizontal")
+        exposure_scale.pack(side="left", fill="x", expand=True)
+        
+        exposure_value = ttk.Label(exposure_frame, textvariable=self.exposure_var, width=5)
+        exposure_value.pack(side="left", padx=(5, 0))
+        self._register_stateful(exposure_label, exposure_scale, exposure_value)
+        
+        # 감마 설정
+        gamma_frame = ttk.Frame(self.hdr_frame)
+        gamma_frame.pack(fill="x", pady=(0, 5))
+        
+        gamma_label = ttk.Label(gamma_frame, text="감마:")
+        gamma_label.pack(side="left", padx=(0, 5))
+        
+        gamma_scale = ttk.Scale(gamma_frame, from_=1.0, to=4.0,
+                               variable=self.gamma_var, 
+                               orient="horizontal")
+        gamma_scale.pack(side="left", fill="x", expand=True)
+        
+        gamma_value = ttk.Label(gamma_frame, textvariable=self.gamma_var, width=5)
+        gamma_value.pack(side="left", padx=(5, 0))
+        self._register_stateful(gamma_label, gamma_scale, gamma_value)
+        
+        # 톤 매핑 방식
+        tone_map_frame = ttk.Frame(self.hdr_frame)
+        tone_map_frame.pack(fill="x")
+        
+        tone_map_label = ttk.Label(tone_map_frame, text="톤 매핑 방식:")
+        tone_map_label.pack(side="left", padx=(0, 5))
+        
+        tone_map_combo = ttk.Combobox(tone_map_frame, 
+                                     textvariable=self.tone_map_var,
+                                     state="readonly")
+        tone_map_combo.pack(side="left", fill="x", expand=True)
+        
+        # 기본 톤 매핑 방식 설정
+        tone_map_combo["values"] = ["Reinhard", "Filmic", "ACES"]
+        self._register_stateful(tone_map_label)
+        self._register_stateful(tone_map_combo, enabled_state="readonly")
+        
+        # 이미 비활성화된 상태라면 새로 만든 위젯에도 적용
+        if self._enabled is False:
+            for widget, _ in self._stateful_widgets[first_widget:]:
+                widget.configure(state="disabled")
+                
     def _update_color_options(self):
         """색 관리 사용 여부에 따라 관련 옵션 위젯 상태 업데이트"""
-        if self.use_color_management.get():
+        # 표시 상태가 바뀌지 않았으면 배치 관리자를 호출하지 않음
+        visible = self.use_color_management.get()
+        if visible == self._profile_visible:
+            return
+        self._profile_visible = visible
+        
+        if visible:
             # 프로파일 선택 활성화
             self.profile_frame.pack(fill="x", pady=(5, 0))
         else:
@@ -199,13 +236,16 @@ class FormatOptionsWidget(ttk.Frame):
         is_input_hdr = input_format in ["EXR"] if input_format else False
         is_output_hdr = output_format in ["EXR"] if output_format else False
         
-        # HDR 변환 관련 옵션 표시 여부 결정
-        if is_input_hdr and not is_output_hdr:
-            # HDR → LDR 변환인 경우 톤 매핑 옵션 표시
-            self.hdr_frame.pack(fill="x", pady=(5, 0), before=self.other_frame)
-        else:
-            # 그 외 경우 HDR 옵션 숨김
-            self.hdr_frame.pack_forget()
+        # HDR 변환 관련 옵션 표시 여부 결정 (HDR → LDR 변환인 경우 톤 매핑 옵션 표시)
+        show_hdr = is_input_hdr and not is_output_hdr
+        if show_hdr != self._hdr_visible:
+            self._hdr_visible = show_hdr
+            if show_hdr:
+                self._build_hdr_frame()
+                self.hdr_frame.pack(fill="x", pady=(5, 0), before=self.other_frame)
+            else:
+                # 그 외 경우 HDR 옵션 숨김
+                self.hdr_frame.pack_forget()
         
         # 저장된 옵션 불러오기
         if saved_options:
@@ -226,35 +266,18 @@ class FormatOptionsWidget(ttk.Frame):
             options[key] = widget_var.get()
         return options
         
+    def _register_stateful(self, *widgets, enabled_state: str = "normal"):
+        """set_enabled로 상태를 바꿀 위젯을 등록합니다."""
+        for widget in widgets:
+            self._stateful_widgets.append((widget, enabled_state))
+            
     def set_enabled(self, enabled: bool):
         """옵션 위젯의 활성화/비활성화 상태를 설정합니다"""
-        state = "normal" if enabled else "disabled"
-        
-        # 색 관리 프레임 내 위젯들
-        for child in self.color_frame.winfo_children():
-            # Checkbutton의 경우 비활성화해도 상태 값은 변경 가능
-            if child.winfo_class() == 'TCheckbutton':
-                child.configure(state=state)
-                
-        # 프로파일 선택 프레임 내 위젯들
-        for child in self.profile_frame.winfo_children():
-            if hasattr(child, 'configure'):
-                child.configure(state=state)
-        
-        # HDR 프레임 내 위젯들
-        for child in self.hdr_frame.winfo_children():
-            if isinstance(child, ttk.Frame):
-                for subchild in child.winfo_children():
-                    if hasattr(subchild, 'configure'):
-                        subchild.configure(state=state)
-            elif hasattr(child, 'configure'):
-                child.configure(state=state)
-        
-        # 기타 옵션 프레임 내 위젯들
-        for child in self.other_frame.winfo_children():
-            if isinstance(child, ttk.Frame):
-                for subchild in child.winfo_children():
-                    if hasattr(subchild, 'configure'):
-                        subchild.configure(state=state)
-            elif hasattr(child, 'configure'):
-                child.configure(state=state) 
\ No newline at end of file
+        # 상태가 바뀌지 않았으면 아무 것도 하지 않음
+        if enabled == self._enabled:
+            return
+        self._enabled = enabled
+        
+        # 등록된 위젯만 순회 (읽기 전용 콤보박스는 활성화 시 readonly로 복원)
+        for widget, enabled_state in self._stateful_widgets:
+            widget.configure(state=enabled_state if enabled else "disabled")
@@ -5,6 +5,8 @@ from typing import Dict, Any
 class ImageInfoDisplay(ttk.LabelFrame):
     def __init__(self, parent, **kwargs):
         super().__init__(parent, text="이미지 정보", padding="10", **kwargs)
+        self._pending_info = None  # 아직 화면에 반영하지 않은 최신 이미지 정보
+        self._idle_id = None  # 예약된 반영 작업 ID
         self._setup_ui()
         
     def _setup_ui(self):
@@ -61,7 +63,21 @@ class ImageInfoDisplay(ttk.LabelFrame):
         }
         
     def update_info(self, info: Dict[str, Any]):
-        """이미지 정보를 업데이트합니다."""
+        """이미지 정보를 업데이트합니다. 연속 호출은 다음 유휴 시점에 마지막 정보로 한 번만 반영합니다."""
+        self._pending_info = info
+        if self._idle_id is None:
+            self._idle_id = self.after_idle(self._apply_pending)
+            
+    def _apply_pending(self):
+        """모아 둔 최신 이미지 정보를 화면에 반영합니다."""
+        self._idle_id = None
+        info = self._pending_info
+        self._pending_info = None
+        if info is not None:
+            self._apply_info(info)
+            
+    def _apply_info(self, info: Dict[str, Any]):
+        """이미지 정보를 카드에 한 번에 반영합니다."""
         if "error" in info:
             # 에러 발생 시 카드 숨기고 에러 메시지 표시
             self.cards_frame.pack_forget()
@@ -83,17 +99,17 @@ class ImageInfoDisplay(ttk.LabelFrame):
             format_info += f" (메타데이터 {len(info['metadata'])}개)"
         self.info_cards["format"]["value_var"].set(format_info)
         
-        # 파일 크기를 적절한 단위로 표시
-        if "file_size_mb" in info:
-            self.info_cards["file_size"]["value_var"].set(f"{info['file_size_mb']:.2f} MB")
-        elif "file_size_bytes" in info:
-            kb_size = info['file_size_bytes'] / 1024
-            self.info_cards["file_size"]["value_var"].set(f"{kb_size:.2f} KB")
-        else:
-            self.info_cards["file_size"]["value_var"].set(f"{info['file_size'] / 1024:.2f} KB")
+        # 파일 크기 (정보 조회 시 미리 만들어 둔 표시 문자열)
+        self.info_cards["file_size"]["value_var"].set(info.get("file_size_display", ""))
         
     def clear(self):
         """정보를 초기화합니다."""
+        # 반영 대기 중인 이전 정보 취소
+        if self._idle_id is not None:
+            self.after_cancel(self._idle_id)
+            self._idle_id = None
+        self._pending_info = None
+        
         for card_info in self.info_cards.values():
             card_info["value_var"].set("")
         self.error_var.set("")
@@ -1,8 +1,48 @@
 import traceback
-import inspect
+import sys
 import os
 from typing import Any, Dict
 
+class _ErrorInfo(dict):
+    """
+    get_detailed_error_info의 반환 딕셔너리.
+    스택 트레이스 문자열은 비용이 크므로 'traceback' 키를 처음 조회할 때 만듭니다.
+    """
+    
+    def __init__(self, exception: Exception, **fields):
+        super().__init__(**fields)
+        self._exception = exception
+        
+    def __missing__(self, key):
+        if key != "traceback":
+            raise KeyError(key)
+        exception = self._exception
+        value = "".join(traceback.format_exception(type(exception), exception, exception.__traceback__))
+        self[key] = value
+        return value
+        
+    def get(self, key, default=None):
+        if key == "traceback":
+            return self[key]
+        return super().get(key, default)
+        
+    # 속성 방식 접근 (딕셔너리 키와 같은 값)
+    @property
+    def type(self) -> str:
+        return self["type"]
+        
+    @property
+    def message(self) -> str:
+        return self["message"]
+        
+    @property
+    def caller(self) -> str:
+        return self["caller"]
+        
+    @property
+    def traceback(self) -> str:
+        return self["traceback"]
+
 def get_detailed_error_info(exception: Exception) -> Dict[str, Any]:
     """
     예외에 대한 상세 정보를 딕셔너리로 반환합니다.
@@ -11,24 +51,18 @@ def get_detailed_error_info(exception: Exception) -> Dict[str, Any]:
         exception: 발생한 예외 객체
         
     Returns:
-        상세 에러 정보를 담은 딕셔너리
+        상세 에러 정보를 담은 딕셔너리 (traceback은 처음 조회할 때 생성)
     """
-    exc_type = type(exception).__name__
-    exc_msg = str(exception)
-    exc_traceback = traceback.format_exc()
-    
     # 호출 스택 정보 수집
-    caller_frame = inspect.currentframe().f_back
-    caller_info = ""
-    if caller_frame:
-        caller_info = f"{os.path.basename(caller_frame.f_code.co_filename)}:{caller_frame.f_lineno}"
+    caller_frame = sys._getframe(1)
+    caller_info = f"{os.path.basename(caller_frame.f_code.co_filename)}:{caller_frame.f_lineno}"
     
-    return {
-        "type": exc_type,
-        "message": exc_msg,
-        "traceback": exc_traceback,
-        "caller": caller_info
-    }
+    return _ErrorInfo(
+        exception,
+        type=type(exception).__name__,
+        message=str(exception),
+        caller=caller_info
+    )
     
 def format_error_for_log(error_info: Dict[str, Any]) -> str:
     """
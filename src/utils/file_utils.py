@@ -3,4 +3,15 @@ def check_file_exists(file_path):
     return os.path.isfile(file_path)
 
 def get_supported_formats():
-    return ['jpg', 'png', 'bmp', 'tiff', 'gif', 'webp']
\ No newline at end of file
+    return ['jpg', 'png', 'bmp', 'tiff', 'gif', 'webp']
+
+# 파일 크기 단위 (단위, 나눌 값) - 인덱스는 1024의 지수
+_SIZE_UNITS = (("B", 1), ("KB", 1024), ("MB", 1024 ** 2), ("GB", 1024 ** 3))
+
+def format_file_size(size_bytes):
+    """파일 크기를 읽기 쉬운 형식으로 변환합니다 (B, KB, MB, GB)."""
+    if size_bytes < 1024:
+        return f"{size_bytes} B"
+    # 비트 길이로 1024의 지수를 구해 단위를 바로 선택 (GB 이상은 GB로 표시)
+    unit, divisor = _SIZE_UNITS[min((size_bytes.bit_length() - 1) // 10, 3)]
+    return format(size_bytes / divisor, ".2f") + " " + unit
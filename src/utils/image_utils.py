@@ -1,262 +1,408 @@
+import os
 import OpenImageIO as oiio
 import numpy as np
-from typing import Dict, Any, Tuple
+from dataclasses import dataclass, asdict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Tuple, Mapping, Union
 
-class ImageFormatUtils:
-    """이미지 포맷 변환에 필요한 유틸리티 함수 모음"""
-    
-    # 포맷 특성 정보
-    FORMAT_PROPERTIES = {
-        'PNG': {
-            'extension': '.png',
-            'has_alpha': True,
-            'compression': 'lossless',
-            'bit_depth': 8,
-            'color_space': 'sRGB',
-            'supports_metadata': True,
-            'is_hdr': False
-        },
-        'JPEG': {
-            'extension': '.jpg',
-            'has_alpha': False,
-            'compression': 'lossy',
-            'bit_depth': 8,
-            'color_space': 'sRGB',
-            'supports_metadata': True,
-            'is_hdr': False
-        },
-        'TIFF': {
-            'extension': '.tif',
-            'has_alpha': True,
-            'compression': 'configurable',
-            'bit_depth': 'variable',  # 8, 16, 32
-            'color_space': 'variable',
-            'supports_metadata': True,
-            'is_hdr': False  # 가능하지만 기본은 SDR
-        },
-        'EXR': {
-            'extension': '.exr',
-            'has_alpha': True,
-            'compression': 'lossless',
-            'bit_depth': 'float',  # 16/32 bit float
-            'color_space': 'linear',
-            'supports_metadata': True,
-            'is_hdr': True
-        },
-        'TGA': {
-            'extension': '.tga',
-            'has_alpha': True,
-            'compression': 'variable',  # RLE 또는 무압축
-            'bit_depth': 8,
-            'color_space': 'sRGB',
-            'supports_metadata': False,
-            'is_hdr': False
-        }
-    }
-    
-    @staticmethod
-    def is_hdr_format(format_name: str) -> bool:
-        """HDR 포맷인지 여부를 반환합니다."""
-        return ImageFormatUtils.FORMAT_PROPERTIES.get(format_name, {}).get('is_hdr', False)
-    
-    @staticmethod
-    def has_alpha_support(format_name: str) -> bool:
-        """알파 채널을 지원하는지 여부를 반환합니다."""
-        return ImageFormatUtils.FORMAT_PROPERTIES.get(format_name, {}).get('has_alpha', False)
-    
-    @staticmethod
-    def get_color_space(format_name: str) -> str:
-        """해당 포맷의 기본 색공간을 반환합니다."""
-        return ImageFormatUtils.FORMAT_PROPERTIES.get(format_name, {}).get('color_space', 'sRGB')
-    
-    @staticmethod
-    def get_format_property(format_name: str, property_name: str, default=None) -> Any:
-        """포맷의 특정 속성을 반환합니다."""
-        return ImageFormatUtils.FORMAT_PROPERTIES.get(format_name, {}).get(property_name, default)
-    
-    @staticmethod
-    def apply_tone_mapping(pixel_data: np.ndarray, 
-                          exposure: float = 1.0, 
-                          gamma: float = 2.2) -> np.ndarray:
-        """
-        HDR 이미지에 톤 매핑을 적용합니다.
-        
-        Args:
-            pixel_data: 픽셀 데이터 배열
-            exposure: 노출 조정 값
-            gamma: 감마 값
-            
-        Returns:
-            톤 매핑이 적용된 픽셀 데이터
-        """
-        # 채널 수 확인 (RGB 또는 RGBA)
-        has_alpha = pixel_data.shape[2] == 4
-        
-        # 알파 채널 분리
+# numexpr는 선택 의존성 (설치되어 있으면 픽셀 연산을 한 번의 다중 스레드 루프로 계산)
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+# numexpr로 계산할 수 있는 실수 형식 (그 외 형식은 NumPy 제자리 연산 사용)
+_NUMEXPR_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+# CuPy도 선택 의존성 (IFC_GPU=1 환경 변수로 켰을 때만 큰 이미지 톤 매핑을 GPU에서 처리)
+try:
+    import cupy as cp
+except ImportError:
+    cp = None
+
+# 포맷 비트 깊이 속성 → OIIO 픽셀 형식
+_DEPTH_TO_OIIO = {
+    8: oiio.TypeDesc(oiio.UINT8),
+    16: oiio.TypeDesc(oiio.UINT16),
+    32: oiio.TypeDesc(oiio.FLOAT),
+    'float': oiio.TypeDesc(oiio.FLOAT),
+}
+
+# GPU로 보낼 최소 픽셀 수 (이보다 작으면 전송 비용이 계산 이득보다 큼)
+_GPU_MIN_PIXELS = 4_000_000
+
+# 톤 매핑을 한 번에 처리하는 블록 크기 (요소 수, float32 기준 약 1MB - CPU 캐시에 머무는 크기)
+_TONE_MAP_BLOCK_ELEMS = 1 << 18
+
+
+@dataclass(frozen=True)
+class FormatInfo:
+    """포맷 특성 정보 (읽기 전용)"""
+    # 인스턴스 dict 없이 슬롯으로 속성 저장 (dataclass의 slots 옵션 없이도 동작하도록 직접 선언)
+    __slots__ = ('extension', 'has_alpha', 'compression', 'bit_depth',
+                 'color_space', 'supports_metadata', 'is_hdr')
+
+    extension: str
+    has_alpha: bool
+    compression: str
+    bit_depth: Union[int, str]
+    color_space: str
+    supports_metadata: bool
+    is_hdr: bool
+
+
+# 포맷 특성 정보
+FORMATS: Dict[str, FormatInfo] = {
+    'PNG': FormatInfo(
+        extension='.png',
+        has_alpha=True,
+        compression='lossless',
+        bit_depth=8,
+        color_space='sRGB',
+        supports_metadata=True,
+        is_hdr=False
+    ),
+    'JPEG': FormatInfo(
+        extension='.jpg',
+        has_alpha=False,
+        compression='lossy',
+        bit_depth=8,
+        color_space='sRGB',
+        supports_metadata=True,
+        is_hdr=False
+    ),
+    'TIFF': FormatInfo(
+        extension='.tif',
+        has_alpha=True,
+        compression='configurable',
+        bit_depth='variable',  # 8, 16, 32
+        color_space='variable',
+        supports_metadata=True,
+        is_hdr=False  # 가능하지만 기본은 SDR
+    ),
+    'EXR': FormatInfo(
+        extension='.exr',
+        has_alpha=True,
+        compression='lossless',
+        bit_depth='float',  # 16/32 bit float
+        color_space='linear',
+        supports_metadata=True,
+        is_hdr=True
+    ),
+    'TGA': FormatInfo(
+        extension='.tga',
+        has_alpha=True,
+        compression='variable',  # RLE 또는 무압축
+        bit_depth=8,
+        color_space='sRGB',
+        supports_metadata=False,
+        is_hdr=False
+    ),
+}
+
+# 자주 조회하는 속성은 모듈 로드 시 한 번만 평면 조회 테이블로 만들어 둠
+_HDR_FORMATS = frozenset(name for name, info in FORMATS.items() if info.is_hdr)
+_ALPHA_FORMATS = frozenset(name for name, info in FORMATS.items() if info.has_alpha)
+_COLOR_SPACES = {name: info.color_space for name, info in FORMATS.items()}
+
+# 출력 포맷별 압축 설정 (SDR 입력용, HDR 입력용)
+_COMPRESSION_TABLE = {
+    # JPEG 압축 품질 (0-100), HDR → JPEG 변환 시 더 높은 품질
+    'JPEG': (MappingProxyType({"quality": 90}), MappingProxyType({"quality": 95})),
+    # PNG 압축 레벨 (0-9)
+    'PNG': (MappingProxyType({"compressionlevel": 6}),) * 2,
+    # TIFF는 Zip 압축, HDR → TIFF 변환 시 무압축
+    'TIFF': (MappingProxyType({"compression": "zip"}), MappingProxyType({"compression": "none"})),
+    # EXR Zip 압축
+    'EXR': (MappingProxyType({"compression": "zip"}),) * 2,
+    # TGA RLE 압축 사용
+    'TGA': (MappingProxyType({"rle": True}),) * 2,
+}
+_NO_SETTINGS = MappingProxyType({})
+
+
+def is_hdr_format(format_name: str) -> bool:
+    """HDR 포맷인지 여부를 반환합니다."""
+    return format_name in _HDR_FORMATS
+
+
+def has_alpha_support(format_name: str) -> bool:
+    """알파 채널을 지원하는지 여부를 반환합니다."""
+    return format_name in _ALPHA_FORMATS
+
+
+def get_color_space(format_name: str) -> str:
+    """해당 포맷의 기본 색공간을 반환합니다."""
+    return _COLOR_SPACES.get(format_name, 'sRGB')
+
+
+def get_format_property(format_name: str, property_name: str, default=None) -> Any:
+    """포맷의 특정 속성을 반환합니다."""
+    info = FORMATS.get(format_name)
+    if info is None:
+        return default
+    return getattr(info, property_name, default)
+
+
+@lru_cache(maxsize=1)
+def _gpu_available() -> bool:
+    """CuPy GPU 경로를 사용할 수 있는지 확인합니다 (최초 1회만 검사)."""
+    if cp is None or os.environ.get("IFC_GPU") != "1":
+        return False
+    try:
+        return cp.cuda.runtime.getDeviceCount() > 0
+    except Exception:
+        return False
+
+
+@lru_cache(maxsize=1)
+def _gpu_tone_map_kernel():
+    """노출, Reinhard, 감마, 클리핑을 한 번에 처리하는 GPU 커널을 만듭니다."""
+    return cp.ElementwiseKernel(
+        'float32 x, float32 exposure, float32 inv_gamma',
+        'float32 y',
+        'float v = x * exposure; v = v / (v + 1.0f); '
+        'y = fminf(1.0f, fmaxf(0.0f, powf(v, inv_gamma)));',
+        'ifc_tone_map')
+
+
+def apply_tone_mapping(pixel_data: np.ndarray, 
+                       exposure: float = 1.0, 
+                       gamma: float = 2.2,
+                       out: np.ndarray = None) -> np.ndarray:
+    """
+    HDR 이미지에 톤 매핑을 적용합니다.
+
+    Args:
+        pixel_data: 픽셀 데이터 배열 ((H, W, C) 형태, C 연속 배열이 아니면 연속 배열로 복사 후 처리)
+        exposure: 노출 조정 값
+        gamma: 감마 값
+        out: 결과를 기록할 배열 (pixel_data와 같은 형태, 없으면 새로 할당)
+
+    Returns:
+        톤 매핑이 적용된 픽셀 데이터
+    """
+    # 잘라낸 뷰 등 비연속 배열은 한 번 연속 배열로 만들어 빠른 벡터 루프를 타도록 함
+    if not pixel_data.flags.c_contiguous:
+        pixel_data = np.ascontiguousarray(pixel_data)
+
+    # 채널 수 확인 (RGB 또는 RGBA)
+    has_alpha = pixel_data.shape[2] == 4
+    color_channels = 3 if has_alpha else pixel_data.shape[2]
+
+    # 실수 데이터는 원래 정밀도를 유지하고, 정수 데이터는 float64로 계산
+    dtype = pixel_data.dtype if pixel_data.dtype.kind == "f" else np.dtype(np.float64)
+    if out is None:
+        out = np.empty(pixel_data.shape, dtype=dtype)
+
+    # 색상 채널은 뷰로 분리하여 결과 배열에 직접 계산 (중간 배열 할당 최소화)
+    rgb_data = pixel_data[:, :, :color_channels]
+    rgb_out = out[:, :, :color_channels]
+
+    height, width = pixel_data.shape[:2]
+    if dtype == np.float32 and height * width >= _GPU_MIN_PIXELS and _gpu_available():
+        # 큰 float32 이미지는 GPU에서 한 번에 계산 후 결과만 되돌려 받음
+        device_rgb = cp.asarray(rgb_data)
+        rgb_out[...] = cp.asnumpy(_gpu_tone_map_kernel()(
+            device_rgb, np.float32(exposure), np.float32(1.0 / gamma)))
         if has_alpha:
-            rgb_data = pixel_data[:, :, :3]
-            alpha = pixel_data[:, :, 3:4]
-        else:
-            rgb_data = pixel_data
-            alpha = None
-        
+            out[:, :, 3] = pixel_data[:, :, 3]
+        return out
+
+    exposure_value = dtype.type(exposure)
+    one = dtype.type(1.0)
+    inv_gamma = dtype.type(1.0 / gamma)
+
+    # 행 블록 단위로 모든 단계를 연속 적용하여, 블록이 캐시에 있는 동안 처리를 끝냄
+    # (이미지 전체를 단계마다 다시 읽고 쓰는 메모리 왕복을 줄임)
+    rows_per_block = max(1, _TONE_MAP_BLOCK_ELEMS // max(1, width * color_channels))
+    scratch = np.empty((min(rows_per_block, height), width, color_channels), dtype=dtype)
+
+    for start in range(0, height, rows_per_block):
+        stop = min(start + rows_per_block, height)
+        block = rgb_out[start:stop]
+        denom = scratch[:stop - start]
+
         # 노출 적용
-        exposed = rgb_data * exposure
-        
-        # 간단한 Reinhard 톤 매핑 적용
-        mapped = exposed / (exposed + 1.0)
-        
+        np.multiply(rgb_data[start:stop], exposure_value, out=block)
+
+        # 간단한 Reinhard 톤 매핑 적용 (x / (x + 1), 분모는 보조 배열 재사용)
+        np.add(block, one, out=denom)
+        np.divide(block, denom, out=block)
+
         # 감마 보정 적용 (Linear to sRGB)
-        gamma_corrected = np.power(mapped, 1.0 / gamma)
-        
+        np.power(block, inv_gamma, out=block)
+
         # 값 범위 조정 (0-1)
-        result = np.clip(gamma_corrected, 0, 1)
-        
-        # 알파 채널 재결합
-        if has_alpha:
-            result = np.concatenate([result, alpha], axis=2)
-            
-        return result
-    
-    @staticmethod
-    def remove_alpha_channel(pixel_data: np.ndarray, background_color=(1, 1, 1)) -> np.ndarray:
-        """
-        알파 채널을 제거하고 배경색과 합성합니다.
-        
-        Args:
-            pixel_data: 픽셀 데이터 배열 (RGBA)
-            background_color: 배경색 (RGB)
-            
-        Returns:
-            알파 채널이 제거된 픽셀 데이터 (RGB)
-        """
-        if pixel_data.shape[2] != 4:
-            return pixel_data  # 이미 알파 채널이 없음
-            
-        rgb = pixel_data[:, :, :3]
-        alpha = pixel_data[:, :, 3:4]
-        
-        # 배경색 생성
-        bg = np.ones_like(rgb) * np.array(background_color)
-        
-        # 알파 합성
-        alpha_expanded = np.repeat(alpha, 3, axis=2)
-        composited = rgb * alpha_expanded + bg * (1 - alpha_expanded)
-        
+        np.clip(block, 0, 1, out=block)
+
+    # 알파 채널은 결과 배열에 그대로 복사 (concatenate로 새 배열을 만들지 않음)
+    if has_alpha:
+        out[:, :, 3] = pixel_data[:, :, 3]
+
+    return out
+
+
+@lru_cache(maxsize=16)
+def _background_array(background_color: Tuple[float, ...], dtype: np.dtype) -> np.ndarray:
+    """배경색을 (1, 1, 3) 형태의 읽기 전용 상수 배열로 만들어 캐시합니다 (H×W×3으로 브로드캐스트)."""
+    bg = np.asarray(background_color[:3], dtype=dtype).reshape(1, 1, 3)
+    bg.flags.writeable = False
+    return bg
+
+
+def remove_alpha_channel(pixel_data: np.ndarray, background_color=(1, 1, 1)) -> np.ndarray:
+    """
+    알파 채널을 제거하고 배경색과 합성합니다.
+
+    Args:
+        pixel_data: 픽셀 데이터 배열 ((H, W, 4) RGBA, C 연속 배열이 아니면 연속 배열로 복사 후 처리)
+        background_color: 배경색 (RGB)
+
+    Returns:
+        알파 채널이 제거된 픽셀 데이터 (RGB)
+    """
+    if pixel_data.shape[2] != 4:
+        return pixel_data  # 이미 알파 채널이 없음
+
+    # 잘라낸 뷰 등 비연속 배열은 한 번 연속 배열로 만들어 빠른 벡터 루프를 타도록 함
+    if not pixel_data.flags.c_contiguous:
+        pixel_data = np.ascontiguousarray(pixel_data)
+
+    rgb = pixel_data[:, :, :3]
+    alpha = pixel_data[:, :, 3:4]  # (H, W, 1) - 색상 채널로 브로드캐스트됨
+
+    # 실수 데이터는 원래 정밀도를 유지하고, 정수 데이터는 float64로 계산
+    dtype = pixel_data.dtype if pixel_data.dtype.kind == "f" else np.dtype(np.float64)
+
+    # 배경색 (RGB, 이미지 크기 배열을 만들지 않고 브로드캐스트)
+    bg = _background_array(tuple(background_color), dtype)
+
+    # 알파 합성: rgb * a + bg * (1 - a) = bg + a * (rgb - bg), 결과 배열 하나에서 계산
+    composited = np.empty(rgb.shape, dtype=dtype)
+
+    if ne is not None and pixel_data.dtype in _NUMEXPR_DTYPES:
+        # 중간 배열 없이 블록 단위로 한 번에 계산 (numexpr는 float16을 지원하지 않음)
+        ne.evaluate("bg + alpha * (rgb - bg)",
+                    local_dict={"rgb": rgb, "alpha": alpha, "bg": bg},
+                    out=composited)
         return composited
-    
-    @staticmethod
-    def adjust_bit_depth(spec: oiio.ImageSpec, target_format: str) -> oiio.ImageSpec:
-        """
-        대상 포맷에 맞게 비트 깊이를 조정합니다.
-        
-        Args:
-            spec: 원본 이미지 스펙
-            target_format: 대상 포맷 이름
-            
-        Returns:
-            조정된 이미지 스펙
-        """
-        # 새로운 스펙 복사
-        new_spec = oiio.ImageSpec(spec)
-        
-        # 대상 포맷의 비트 깊이 속성 가져오기
-        bit_depth = ImageFormatUtils.get_format_property(target_format, 'bit_depth')
-        
-        # 비트 깊이 조정
-        if bit_depth == 8:
-            new_spec.format = oiio.UINT8
-        elif bit_depth == 16:
-            new_spec.format = oiio.UINT16
-        elif bit_depth == 'float' or bit_depth == 32:
-            new_spec.format = oiio.FLOAT
-        
-        return new_spec
-    
-    @staticmethod
-    def get_optimal_compression(input_format: str, output_format: str) -> Dict[str, Any]:
-        """
-        입출력 포맷에 따른 최적의 압축 설정을 반환합니다.
-        
-        Args:
-            input_format: 입력 포맷 이름
-            output_format: 출력 포맷 이름
-            
-        Returns:
-            압축 설정 딕셔너리
-        """
-        compression_settings = {}
-        
-        if output_format == "JPEG":
-            # JPEG 압축 품질 설정 (0-100)
-            compression_settings["quality"] = 90  # 기본값
-            
-            # HDR → JPEG 변환 시 더 높은 품질
-            if ImageFormatUtils.is_hdr_format(input_format):
-                compression_settings["quality"] = 95
-                
-        elif output_format == "PNG":
-            # PNG 압축 레벨 (0-9)
-            compression_settings["compressionlevel"] = 6  # 기본값
-            
-        elif output_format == "TIFF":
-            # TIFF 압축 방식
-            compression_settings["compression"] = "zip"  # Zip 압축
-            
-            # HDR → TIFF 변환 시
-            if ImageFormatUtils.is_hdr_format(input_format):
-                compression_settings["compression"] = "none"  # 무압축
-                
-        elif output_format == "EXR":
-            # EXR 압축 방식
-            compression_settings["compression"] = "zip"  # Zip 압축
-            
-        elif output_format == "TGA":
-            # TGA 압축 여부
-            compression_settings["rle"] = True  # RLE 압축 사용
-        
-        return compression_settings
-    
-    @staticmethod
-    def get_conversion_settings(input_format: str, output_format: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
-        """
-        입출력 포맷에 따른 변환 설정을 반환합니다.
-        
-        Args:
-            input_format: 입력 포맷 이름
-            output_format: 출력 포맷 이름
-            
-        Returns:
-            (전처리 설정, 후처리 설정) 튜플
-        """
-        pre_settings = {}
-        post_settings = {}
-        
-        # HDR → LDR 변환 설정
-        if ImageFormatUtils.is_hdr_format(input_format) and not ImageFormatUtils.is_hdr_format(output_format):
-            pre_settings["apply_tone_mapping"] = True
-            pre_settings["exposure"] = 1.0
-            pre_settings["gamma"] = 2.2
-        
-        # LDR → HDR 변환 설정 (HDR 출력 형식 최적화)
-        if not ImageFormatUtils.is_hdr_format(input_format) and ImageFormatUtils.is_hdr_format(output_format):
-            # HDR 출력 시 float 형식으로 변환 보장
-            post_settings["format"] = "float"
-            
-            # HDR은 일반적으로 linear 색 공간 사용
-            post_settings["colorspace"] = "linear"
-            
-        # HDR → HDR 변환 설정
-        if ImageFormatUtils.is_hdr_format(input_format) and ImageFormatUtils.is_hdr_format(output_format):
-            # float 형식 보장
-            post_settings["format"] = "float"
-        
-        # 알파 채널 처리
-        if ImageFormatUtils.has_alpha_support(input_format) and not ImageFormatUtils.has_alpha_support(output_format):
-            pre_settings["remove_alpha"] = True
-            pre_settings["background_color"] = (1, 1, 1)  # 흰색 배경
-        
-        # 압축 설정
-        post_settings.update(ImageFormatUtils.get_optimal_compression(input_format, output_format))
-        
-        return pre_settings, post_settings 
\ No newline at end of file
+
+    np.subtract(rgb, bg, out=composited)
+    np.multiply(composited, alpha, out=composited)
+    np.add(composited, bg, out=composited)
+
+    return composited
+
+
+def adjust_bit_depth(spec: oiio.ImageSpec, target_format: str) -> oiio.ImageSpec:
+    """
+    대상 포맷에 맞게 비트 깊이를 조정합니다.
+
+    Args:
+        spec: 원본 이미지 스펙
+        target_format: 대상 포맷 이름
+
+    Returns:
+        조정된 이미지 스펙 (변경할 필요가 없으면 원본 스펙 그대로)
+    """
+    # 대상 포맷의 비트 깊이에 해당하는 픽셀 형식 ('variable' 등은 원본 유지)
+    pixel_format = _DEPTH_TO_OIIO.get(get_format_property(target_format, 'bit_depth'))
+    if pixel_format is None or spec.format == pixel_format:
+        # 메타데이터까지 복사하는 스펙 복제를 생략
+        return spec
+
+    # 형식이 바뀔 때만 스펙을 복사 (메타데이터는 그대로 유지)
+    new_spec = oiio.ImageSpec(spec)
+    new_spec.format = pixel_format
+    return new_spec
+
+
+def get_optimal_compression(input_format: str, output_format: str) -> Dict[str, Any]:
+    """
+    입출력 포맷에 따른 최적의 압축 설정을 반환합니다.
+
+    Args:
+        input_format: 입력 포맷 이름
+        output_format: 출력 포맷 이름
+
+    Returns:
+        압축 설정 딕셔너리 (호출자가 수정해도 되는 복사본)
+    """
+    return dict(_compression_settings(input_format, output_format))
+
+
+def _compression_settings(input_format: str, output_format: str) -> Mapping[str, Any]:
+    """포맷 조합별 압축 설정을 표에서 찾아 반환합니다 (읽기 전용 매핑)."""
+    settings = _COMPRESSION_TABLE.get(output_format)
+    if settings is None:
+        return _NO_SETTINGS
+    return settings[is_hdr_format(input_format)]
+
+
+def get_conversion_settings(input_format: str, output_format: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    입출력 포맷에 따른 변환 설정을 반환합니다.
+
+    Args:
+        input_format: 입력 포맷 이름
+        output_format: 출력 포맷 이름
+
+    Returns:
+        (전처리 설정, 후처리 설정) 튜플 (호출자가 수정해도 되는 복사본)
+    """
+    pre_settings, post_settings = _cached_conversion_settings(input_format, output_format)
+    return dict(pre_settings), dict(post_settings)
+
+
+@lru_cache(maxsize=64)
+def _cached_conversion_settings(input_format: str, output_format: str) -> Tuple[Mapping[str, Any], Mapping[str, Any]]:
+    """포맷 조합별 변환 설정을 계산하여 캐시합니다 (읽기 전용 매핑 반환)."""
+    pre_settings = {}
+    post_settings = {}
+
+    # HDR → LDR 변환 설정
+    if is_hdr_format(input_format) and not is_hdr_format(output_format):
+        pre_settings["apply_tone_mapping"] = True
+        pre_settings["exposure"] = 1.0
+        pre_settings["gamma"] = 2.2
+
+    # LDR → HDR 변환 설정 (HDR 출력 형식 최적화)
+    if not is_hdr_format(input_format) and is_hdr_format(output_format):
+        # HDR 출력 시 float 형식으로 변환 보장
+        post_settings["format"] = "float"
+
+        # HDR은 일반적으로 linear 색 공간 사용
+        post_settings["colorspace"] = "linear"
+
+    # HDR → HDR 변환 설정
+    if is_hdr_format(input_format) and is_hdr_format(output_format):
+        # float 형식 보장
+        post_settings["format"] = "float"
+
+    # 알파 채널 처리
+    if has_alpha_support(input_format) and not has_alpha_support(output_format):
+        pre_settings["remove_alpha"] = True
+        pre_settings["background_color"] = (1, 1, 1)  # 흰색 배경
+
+    # 압축 설정
+    post_settings.update(_compression_settings(input_format, output_format))
+
+    return MappingProxyType(pre_settings), MappingProxyType(post_settings)
+
+
+class ImageFormatUtils:
+    """이전 호출 코드 호환용 래퍼 (모듈 함수에 위임)"""
+
+    FORMAT_PROPERTIES = {name: asdict(info) for name, info in FORMATS.items()}
+
+    is_hdr_format = staticmethod(is_hdr_format)
+    has_alpha_support = staticmethod(has_alpha_support)
+    get_color_space = staticmethod(get_color_space)
+    get_format_property = staticmethod(get_format_property)
+    apply_tone_mapping = staticmethod(apply_tone_mapping)
+    remove_alpha_channel = staticmethod(remove_alpha_channel)
+    adjust_bit_depth = staticmethod(adjust_bit_depth)
+    get_optimal_compression = staticmethod(get_optimal_compression)
+    get_conversion_settings = staticmethod(get_conversion_settings)
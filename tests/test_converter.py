@@ -3,8 +3,10 @@ from src.converter import ImageConverter
 
 class TestImageConverter(unittest.TestCase):
 
-    def setUp(self):
-        self.converter = ImageConverter()
+    @classmethod
+    def setUpClass(cls):
+        # Converter initialization (OIIO setup) runs once for the whole class
+        cls.converter = ImageConverter()
 
     def test_convert_image_valid(self):
         input_path = 'resources/sample_images/test_image.jpg'
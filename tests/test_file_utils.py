@@ -3,17 +3,26 @@ from src.utils.file_utils import check_file_exists, get_supported_formats
 
 class TestFileUtils(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # get_supported_formats is a pure function, so call it once for the whole class
+        cls.supported_formats = get_supported_formats()
+
     def test_check_file_exists(self):
-        # Test with a valid file path
-        self.assertTrue(check_file_exists('resources/sample_images/sample_image.jpg'))
-        
-        # Test with an invalid file path
-        self.assertFalse(check_file_exists('invalid/path/to/file.jpg'))
+        cases = [
+            # Test with a valid file path
+            ('resources/sample_images/sample_image.jpg', True),
+            # Test with an invalid file path
+            ('invalid/path/to/file.jpg', False),
+        ]
+        for path, expected in cases:
+            with self.subTest(path=path):
+                self.assertEqual(check_file_exists(path), expected)
 
     def test_get_supported_formats(self):
         # Test if the supported formats are returned correctly
         expected_formats = ['jpg', 'png', 'tiff', 'bmp', 'gif']
-        self.assertEqual(get_supported_formats(), expected_formats)
+        self.assertEqual(self.supported_formats, expected_formats)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
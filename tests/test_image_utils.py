@@ -0,0 +1,117 @@
+import unittest
+import numpy as np
+from src.utils.image_utils import apply_tone_mapping, remove_alpha_channel
+
+
+def reference_tone_mapping(pixel_data, exposure, gamma):
+    # Original formula: exposure, Reinhard x / (x + 1), gamma, clip, alpha untouched
+    data = pixel_data.astype(np.float64)
+    rgb = data[:, :, :3] if data.shape[2] == 4 else data
+    rgb = rgb * exposure
+    rgb = rgb / (rgb + 1)
+    rgb = np.power(rgb, 1.0 / gamma)
+    rgb = np.clip(rgb, 0, 1)
+    if data.shape[2] == 4:
+        return np.concatenate([rgb, data[:, :, 3:4]], axis=2)
+    return rgb
+
+
+def reference_remove_alpha(pixel_data, background_color):
+    # Original formula: rgb * a + bg * (1 - a)
+    data = pixel_data.astype(np.float64)
+    rgb = data[:, :, :3]
+    alpha = data[:, :, 3:4]
+    bg = np.ones_like(rgb) * np.array(background_color, dtype=np.float64)
+    return rgb * alpha + bg * (1 - alpha)
+
+
+def make_image(height, width, channels, dtype, seed=0):
+    rng = np.random.default_rng(seed)
+    data = rng.uniform(0.0, 4.0, size=(height, width, channels))
+    if channels == 4:
+        data[:, :, 3] = rng.uniform(0.0, 1.0, size=(height, width))
+    return data.astype(dtype)
+
+
+class TestApplyToneMapping(unittest.TestCase):
+
+    def test_matches_reference(self):
+        for dtype in (np.float32, np.float64):
+            for channels in (3, 4):
+                for use_out in (False, True):
+                    with self.subTest(dtype=dtype, channels=channels, use_out=use_out):
+                        image = make_image(16, 12, channels, dtype)
+                        out = np.empty_like(image) if use_out else None
+                        result = apply_tone_mapping(image, 1.5, 2.2, out=out)
+
+                        self.assertEqual(result.dtype, np.dtype(dtype))
+                        self.assertEqual(result.shape, image.shape)
+                        if use_out:
+                            self.assertIs(result, out)
+                        rtol = 1e-5 if dtype == np.float32 else 1e-12
+                        np.testing.assert_allclose(result, reference_tone_mapping(image, 1.5, 2.2), rtol=rtol)
+
+    def test_non_contiguous_input(self):
+        image = make_image(20, 30, 4, np.float32)[:, ::2]
+        self.assertFalse(image.flags.c_contiguous)
+        result = apply_tone_mapping(image, 0.8, 2.4)
+        np.testing.assert_allclose(result, reference_tone_mapping(image, 0.8, 2.4), rtol=1e-5)
+
+    def test_integer_input(self):
+        image = (make_image(8, 8, 3, np.float64) * 60).astype(np.uint16)
+        result = apply_tone_mapping(image, 1.0, 2.2)
+        self.assertEqual(result.dtype, np.float64)
+        np.testing.assert_allclose(result, reference_tone_mapping(image, 1.0, 2.2), rtol=1e-12)
+
+    def test_larger_than_one_block(self):
+        # 300 x 400 x 3 = 360000 elements, more than one 2**18 row block
+        image = make_image(300, 400, 4, np.float32)
+        result = apply_tone_mapping(image, 2.0, 2.2)
+        np.testing.assert_allclose(result, reference_tone_mapping(image, 2.0, 2.2), rtol=1e-5)
+
+
+class TestRemoveAlphaChannel(unittest.TestCase):
+
+    def test_matches_reference(self):
+        for dtype in (np.float32, np.float64):
+            for background in ((1, 1, 1), (0.2, 0.5, 0.0)):
+                with self.subTest(dtype=dtype, background=background):
+                    image = make_image(16, 12, 4, dtype)
+                    result = remove_alpha_channel(image, background)
+
+                    self.assertEqual(result.dtype, np.dtype(dtype))
+                    self.assertEqual(result.shape, (16, 12, 3))
+                    rtol = 1e-5 if dtype == np.float32 else 1e-12
+                    np.testing.assert_allclose(result, reference_remove_alpha(image, background), rtol=rtol)
+
+    def test_rgb_input_is_returned_unchanged(self):
+        image = make_image(4, 4, 3, np.float32)
+        self.assertIs(remove_alpha_channel(image), image)
+
+    def test_background_list(self):
+        image = make_image(6, 6, 4, np.float64)
+        result = remove_alpha_channel(image, [0.0, 0.25, 1.0])
+        np.testing.assert_allclose(result, reference_remove_alpha(image, (0.0, 0.25, 1.0)), rtol=1e-12)
+
+    def test_non_contiguous_input(self):
+        image = make_image(10, 20, 4, np.float32)[::2]
+        self.assertFalse(image.flags.c_contiguous)
+        result = remove_alpha_channel(image, (0.5, 0.5, 0.5))
+        np.testing.assert_allclose(result, reference_remove_alpha(image, (0.5, 0.5, 0.5)), rtol=1e-5)
+
+    def test_integer_input(self):
+        image = np.zeros((5, 5, 4), dtype=np.uint8)
+        image[:, :, :3] = 200
+        image[:, :, 3] = 1
+        result = remove_alpha_channel(image, (1, 1, 1))
+        self.assertEqual(result.dtype, np.float64)
+        np.testing.assert_allclose(result, reference_remove_alpha(image, (1, 1, 1)), rtol=1e-12)
+
+    def test_half_float_input(self):
+        image = make_image(6, 6, 4, np.float16)
+        result = remove_alpha_channel(image, (1, 1, 1))
+        self.assertEqual(result.dtype, np.float16)
+        np.testing.assert_allclose(result, reference_remove_alpha(image, (1, 1, 1)), rtol=1e-2, atol=1e-2)
+
+if __name__ == '__main__':
+    unittest.main()